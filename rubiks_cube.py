@@ -6,119 +6,180 @@ Enhanced with CubeStateTracker and Cube class integration
 
 import random
 import copy
+import re
+import sys
+from collections import Counter
+from functools import cached_property, lru_cache
+from operator import eq, getitem, itemgetter, xor
+
+# Sticker colors are stored as small ints; names and letters are only looked up for display
+WHITE, YELLOW, RED, ORANGE, GREEN, BLUE = range(6)
+COLOR_NAMES = ('WHITE', 'YELLOW', 'RED', 'ORANGE', 'GREEN', 'BLUE')
+_COLOR_LETTERS = 'WYROGB'
+
+# Byte translation from color id to its ASCII digit, for get_state_string
+_STICKER_DIGITS = bytes.maketrans(bytes(range(6)), b'012345')
+
+# Solved tracker arrays: every piece in its own slot with zero orientation
+_SOLVED_EP = tuple(range(12))
+_SOLVED_EO = (0,) * 12
+_SOLVED_CP = tuple(range(8))
+_SOLVED_CO = (0,) * 8
+_SOLVED_EDGE_PAIRS = tuple(zip(_SOLVED_EP, _SOLVED_EO))
+_SOLVED_CORNER_PAIRS = tuple(zip(_SOLVED_CP, _SOLVED_CO))
+
+# Sorted piece ids of a valid state, for the permutation check in validate_state
+_EDGE_SLOTS = list(range(12))
+_CORNER_SLOTS = list(range(8))
+
+# Quarter-turn cycle data for each face, shared by every tracker
+_TRACKER_CYCLES = {
+    'U': {
+        'edges': [(0, 1), (1, 2), (2, 3), (3, 0)],  # UF->UR->UB->UL->UF
+        'corners': [(0, 1), (1, 2), (2, 3), (3, 0)],  # UFR->UFL->UBL->UBR->UFR
+        'edge_orient_flip': [],
+        'corner_orient_change': [],
+    },
+    'D': {
+        'edges': [(4, 7), (7, 6), (6, 5), (5, 4)],  # DF->DL->DB->DR->DF
+        'corners': [(4, 5), (5, 6), (6, 7), (7, 4)],  # DFR->DFL->DBL->DBR->DFR
+        'edge_orient_flip': [],
+        'corner_orient_change': [],
+    },
+    'R': {
+        'edges': [(1, 8), (8, 5), (5, 10), (10, 1)],  # UR->FR->DR->BR->UR
+        'corners': [(0, 4), (4, 7), (7, 3), (3, 0)],  # UFR->DFR->DBR->UBR->UFR
+        'edge_orient_flip': [],
+        'corner_orient_change': [(0, 1), (4, 2), (7, 1), (3, 2)],  # clockwise rotation changes
+    },
+    'L': {
+        'edges': [(3, 11), (11, 7), (7, 9), (9, 3)],  # UL->BL->DL->FL->UL
+        'corners': [(1, 2), (2, 6), (6, 5), (5, 1)],  # UFL->UBL->DBL->DFL->UFL
+        'edge_orient_flip': [],
+        'corner_orient_change': [(1, 2), (2, 1), (6, 2), (5, 1)],
+    },
+    'F': {
+        'edges': [(0, 9), (9, 4), (4, 8), (8, 0)],  # UF->FL->DF->FR->UF
+        'corners': [(0, 1), (1, 5), (5, 4), (4, 0)],  # UFR->UFL->DFL->DFR->UFR
+        'edge_orient_flip': [0, 9, 4, 8],  # Front moves flip edge orientations
+        'corner_orient_change': [(0, 2), (1, 1), (5, 2), (4, 1)],
+    },
+    'B': {
+        'edges': [(2, 10), (10, 6), (6, 11), (11, 2)],  # UB->BR->DB->BL->UB
+        'corners': [(3, 2), (2, 6), (6, 7), (7, 3)],  # UBR->UBL->DBL->DBR->UBR
+        'edge_orient_flip': [2, 10, 6, 11],  # Back moves flip edge orientations
+        'corner_orient_change': [(3, 1), (2, 2), (6, 1), (7, 2)],
+    }
+}
+
+# (orientation + delta) % 3 as a lookup: _TWIST_ROWS[delta][orientation]
+_TWIST_ROWS = ((0, 1, 2), (1, 2, 0), (2, 0, 1))
+
+# Tracker moves per token, compiled once from the quarter-turn cycle tables:
+# token -> (edge gather, edge flips, corner gather, per-slot twist rows)
+_TRACKER_MOVES = {}
+
+def _get_tracker_moves():
+    """Compile every face turn, prime and double into a single tracker update"""
+    if not _TRACKER_MOVES:
+        # Run the quarter-turn walker on identity arrays; what it leaves behind is the
+        # slot permutation and the orientation change of the whole token
+        scratch = object.__new__(CubeStateTracker)
+        scratch.move_tables = _TRACKER_CYCLES
+        for face in _TRACKER_CYCLES:
+            for suffix, turns in (('', 1), ('2', 2), ("'", 3)):
+                scratch.ep, scratch.eo = list(range(12)), [0] * 12
+                scratch.cp, scratch.co = list(range(8)), [0] * 8
+                for _ in range(turns):
+                    scratch._apply_single_move(face)
+                _TRACKER_MOVES[sys.intern(face + suffix)] = (itemgetter(*scratch.ep), tuple(scratch.eo),
+                                                             itemgetter(*scratch.cp),
+                                                             tuple([_TWIST_ROWS[delta] for delta in scratch.co]))
+    return _TRACKER_MOVES
 
 class CubeStateTracker:
     """Tracks piece positions and orientations for precise cube state management"""
     
+    # Define solved state for edges (12 edges total) - class-level, shared read-only by every tracker
+    solved_edges = [
+        {'id': 'UF', 'position': 0, 'orientation': 0},  # Up-Front
+        {'id': 'UR', 'position': 1, 'orientation': 0},  # Up-Right
+        {'id': 'UB', 'position': 2, 'orientation': 0},  # Up-Back
+        {'id': 'UL', 'position': 3, 'orientation': 0},  # Up-Left
+        {'id': 'DF', 'position': 4, 'orientation': 0},  # Down-Front
+        {'id': 'DR', 'position': 5, 'orientation': 0},  # Down-Right
+        {'id': 'DB', 'position': 6, 'orientation': 0},  # Down-Back
+        {'id': 'DL', 'position': 7, 'orientation': 0},  # Down-Left
+        {'id': 'FR', 'position': 8, 'orientation': 0},  # Front-Right
+        {'id': 'FL', 'position': 9, 'orientation': 0},  # Front-Left
+        {'id': 'BR', 'position': 10, 'orientation': 0}, # Back-Right
+        {'id': 'BL', 'position': 11, 'orientation': 0}, # Back-Left
+    ]
+    
+    # Define solved state for corners (8 corners total)
+    solved_corners = [
+        {'id': 'UFR', 'position': 0, 'orientation': 0},  # Up-Front-Right
+        {'id': 'UFL', 'position': 1, 'orientation': 0},  # Up-Front-Left
+        {'id': 'UBL', 'position': 2, 'orientation': 0},  # Up-Back-Left
+        {'id': 'UBR', 'position': 3, 'orientation': 0},  # Up-Back-Right
+        {'id': 'DFR', 'position': 4, 'orientation': 0},  # Down-Front-Right
+        {'id': 'DFL', 'position': 5, 'orientation': 0},  # Down-Front-Left
+        {'id': 'DBL', 'position': 6, 'orientation': 0},  # Down-Back-Left
+        {'id': 'DBR', 'position': 7, 'orientation': 0},  # Down-Back-Right
+    ]
+    
     def __init__(self):
-        # Define solved state for edges (12 edges total)
-        self.solved_edges = [
-            {'id': 'UF', 'position': 0, 'orientation': 0},  # Up-Front
-            {'id': 'UR', 'position': 1, 'orientation': 0},  # Up-Right
-            {'id': 'UB', 'position': 2, 'orientation': 0},  # Up-Back
-            {'id': 'UL', 'position': 3, 'orientation': 0},  # Up-Left
-            {'id': 'DF', 'position': 4, 'orientation': 0},  # Down-Front
-            {'id': 'DR', 'position': 5, 'orientation': 0},  # Down-Right
-            {'id': 'DB', 'position': 6, 'orientation': 0},  # Down-Back
-            {'id': 'DL', 'position': 7, 'orientation': 0},  # Down-Left
-            {'id': 'FR', 'position': 8, 'orientation': 0},  # Front-Right
-            {'id': 'FL', 'position': 9, 'orientation': 0},  # Front-Left
-            {'id': 'BR', 'position': 10, 'orientation': 0}, # Back-Right
-            {'id': 'BL', 'position': 11, 'orientation': 0}, # Back-Left
-        ]
-        
-        # Define solved state for corners (8 corners total)
-        self.solved_corners = [
-            {'id': 'UFR', 'position': 0, 'orientation': 0},  # Up-Front-Right
-            {'id': 'UFL', 'position': 1, 'orientation': 0},  # Up-Front-Left
-            {'id': 'UBL', 'position': 2, 'orientation': 0},  # Up-Back-Left
-            {'id': 'UBR', 'position': 3, 'orientation': 0},  # Up-Back-Right
-            {'id': 'DFR', 'position': 4, 'orientation': 0},  # Down-Front-Right
-            {'id': 'DFL', 'position': 5, 'orientation': 0},  # Down-Front-Left
-            {'id': 'DBL', 'position': 6, 'orientation': 0},  # Down-Back-Left
-            {'id': 'DBR', 'position': 7, 'orientation': 0},  # Down-Back-Right
-        ]
-        
-        # Initialize current state as solved
-        self.edges = copy.deepcopy(self.solved_edges)
-        self.corners = copy.deepcopy(self.solved_corners)
+        # Current state as flat arrays indexed by slot: which piece sits there
+        # (its solved position) and its orientation
+        self.reset()
         
         # Define move tables for each face rotation
-        self.move_tables = {
-            'U': {
-                'edges': [(0, 1), (1, 2), (2, 3), (3, 0)],  # UF->UR->UB->UL->UF
-                'corners': [(0, 1), (1, 2), (2, 3), (3, 0)],  # UFR->UFL->UBL->UBR->UFR
-                'edge_orient_flip': [],
-                'corner_orient_change': [],
-            },
-            'D': {
-                'edges': [(4, 7), (7, 6), (6, 5), (5, 4)],  # DF->DL->DB->DR->DF
-                'corners': [(4, 5), (5, 6), (6, 7), (7, 4)],  # DFR->DFL->DBL->DBR->DFR
-                'edge_orient_flip': [],
-                'corner_orient_change': [],
-            },
-            'R': {
-                'edges': [(1, 8), (8, 5), (5, 10), (10, 1)],  # UR->FR->DR->BR->UR
-                'corners': [(0, 4), (4, 7), (7, 3), (3, 0)],  # UFR->DFR->DBR->UBR->UFR
-                'edge_orient_flip': [],
-                'corner_orient_change': [(0, 1), (4, 2), (7, 1), (3, 2)],  # clockwise rotation changes
-            },
-            'L': {
-                'edges': [(3, 11), (11, 7), (7, 9), (9, 3)],  # UL->BL->DL->FL->UL
-                'corners': [(1, 2), (2, 6), (6, 5), (5, 1)],  # UFL->UBL->DBL->DFL->UFL
-                'edge_orient_flip': [],
-                'corner_orient_change': [(1, 2), (2, 1), (6, 2), (5, 1)],
-            },
-            'F': {
-                'edges': [(0, 9), (9, 4), (4, 8), (8, 0)],  # UF->FL->DF->FR->UF
-                'corners': [(0, 1), (1, 5), (5, 4), (4, 0)],  # UFR->UFL->DFL->DFR->UFR
-                'edge_orient_flip': [0, 9, 4, 8],  # Front moves flip edge orientations
-                'corner_orient_change': [(0, 2), (1, 1), (5, 2), (4, 1)],
-            },
-            'B': {
-                'edges': [(2, 10), (10, 6), (6, 11), (11, 2)],  # UB->BR->DB->BL->UB
-                'corners': [(3, 2), (2, 6), (6, 7), (7, 3)],  # UBR->UBL->DBL->DBR->UBR
-                'edge_orient_flip': [2, 10, 6, 11],  # Back moves flip edge orientations
-                'corner_orient_change': [(3, 1), (2, 2), (6, 1), (7, 2)],
-            }
-        }
+        self.move_tables = _TRACKER_CYCLES
+        
+        # Every move token (U, U', U2, ...) compiled to one permutation plus orientation update
+        self._token_moves = _get_tracker_moves()
+    
+    def reset(self):
+        """Return every piece to its solved slot and orientation"""
+        self.ep = _SOLVED_EP
+        self.eo = _SOLVED_EO
+        self.cp = _SOLVED_CP
+        self.co = _SOLVED_CO
     
     def apply_move(self, move):
         """Apply a move to update piece positions and orientations"""
-        # Handle prime moves
-        if move.endswith("'"):
-            base_move = move[0]
-            # Apply the move 3 times (equivalent to prime)
-            for _ in range(3):
-                self._apply_single_move(base_move)
-        elif move.endswith('2'):
-            base_move = move[0]
-            # Apply the move twice
-            for _ in range(2):
-                self._apply_single_move(base_move)
-        else:
-            self._apply_single_move(move)
+        entry = self._token_moves.get(move)
+        if entry is None:
+            return  # slice moves and unknown tokens don't move tracked pieces
+        
+        edge_perm, edge_flip, corner_perm, twist_rows = entry
+        self.ep = edge_perm(self.ep)
+        self.eo = tuple(map(xor, edge_perm(self.eo), edge_flip))
+        self.cp = corner_perm(self.cp)
+        self.co = tuple(map(getitem, twist_rows, corner_perm(self.co)))
     
     def _apply_single_move(self, move):
-        """Apply a single move transformation"""
+        """Apply a single quarter turn by walking its cycle table - used to compile the move tables"""
         if move not in self.move_tables:
             return
         
         table = self.move_tables[move]
         
-        # Rotate edges
-        self._permute_pieces(self.edges, table['edges'])
+        # Rotate edges (pieces carry their orientation with them)
+        self._permute_pieces(self.ep, table['edges'])
+        self._permute_pieces(self.eo, table['edges'])
         
         # Rotate corners
-        self._permute_pieces(self.corners, table['corners'])
+        self._permute_pieces(self.cp, table['corners'])
+        self._permute_pieces(self.co, table['corners'])
         
         # Update edge orientations
         for idx in table['edge_orient_flip']:
-            self.edges[idx]['orientation'] ^= 1  # Flip orientation (0->1, 1->0)
+            self.eo[idx] ^= 1  # Flip orientation (0->1, 1->0)
         
         # Update corner orientations
         for idx, delta in table.get('corner_orient_change', []):
-            self.corners[idx]['orientation'] = (self.corners[idx]['orientation'] + delta) % 3
+            self.co[idx] = (self.co[idx] + delta) % 3
     
     def _permute_pieces(self, pieces, cycles):
         """Apply permutation cycles to pieces"""
@@ -127,64 +188,110 @@ class CubeStateTracker:
                 continue
             
             # Store the first piece
-            temp = copy.deepcopy(pieces[cycle[0]])
+            temp = pieces[cycle[0]]
             
-            # Shift pieces along the cycle
+            # Shift pieces along the cycle (plain references - slots hold ints)
             for i in range(len(cycle) - 1):
-                pieces[cycle[i]] = copy.deepcopy(pieces[cycle[i + 1]])
+                pieces[cycle[i]] = pieces[cycle[i + 1]]
             
             # Place the first piece at the end of the cycle
             pieces[cycle[-1]] = temp
     
+    @property
+    def edges(self):
+        """Per-slot edge dicts ({'id', 'position', 'orientation'}) built from the flat arrays"""
+        return [{'id': self.solved_edges[piece]['id'], 'position': piece, 'orientation': orientation}
+                for piece, orientation in zip(self.ep, self.eo)]
+    
+    @property
+    def corners(self):
+        """Per-slot corner dicts ({'id', 'position', 'orientation'}) built from the flat arrays"""
+        return [{'id': self.solved_corners[piece]['id'], 'position': piece, 'orientation': orientation}
+                for piece, orientation in zip(self.cp, self.co)]
+    
     def is_edge_solved(self, idx):
         """Check if an edge is in its solved position and orientation"""
-        edge = self.edges[idx]
-        solved = self.solved_edges[idx]
-        return edge['id'] == solved['id'] and edge['orientation'] == solved['orientation']
+        return self.ep[idx] == idx and self.eo[idx] == 0
     
     def is_corner_solved(self, idx):
         """Check if a corner is in its solved position and orientation"""
-        corner = self.corners[idx]
-        solved = self.solved_corners[idx]
-        return corner['id'] == solved['id'] and corner['orientation'] == solved['orientation']
+        return self.cp[idx] == idx and self.co[idx] == 0
+    
+    def count_solved_edges(self):
+        """Number of edges in their solved position and orientation"""
+        return sum(map(eq, zip(self.ep, self.eo), _SOLVED_EDGE_PAIRS))
+    
+    def count_solved_corners(self):
+        """Number of corners in their solved position and orientation"""
+        return sum(map(eq, zip(self.cp, self.co), _SOLVED_CORNER_PAIRS))
     
     def is_cube_solved(self):
         """Check if the entire cube is solved"""
-        return (all(self.is_edge_solved(i) for i in range(12)) and 
-                all(self.is_corner_solved(i) for i in range(8)))
+        return (self.ep == _SOLVED_EP and self.cp == _SOLVED_CP
+                and self.eo == _SOLVED_EO and self.co == _SOLVED_CO)
+    
+    def pack_state(self):
+        """Pack corners and edges into two integers (8 x 5 bits and 12 x 5 bits)"""
+        corners = 0
+        for slot in range(8):
+            corners |= (self.cp[slot] << 2 | self.co[slot]) << (5 * slot)
+        
+        edges = 0
+        for slot in range(12):
+            edges |= (self.ep[slot] << 1 | self.eo[slot]) << (5 * slot)
+        
+        return corners, edges
+    
+    def pack(self):
+        """Pack the whole tracker state into one integer key (corners above the 60 edge bits)"""
+        corners, edges = self.pack_state()
+        return corners << 60 | edges
+    
+    def unpack_state(self, corners, edges):
+        """Restore corners and edges from integers produced by pack_state"""
+        corner_fields = [(corners >> (5 * slot)) & 0b11111 for slot in range(8)]
+        self.cp = tuple([field >> 2 for field in corner_fields])
+        self.co = tuple([field & 0b11 for field in corner_fields])
+        
+        edge_fields = [(edges >> (5 * slot)) & 0b11111 for slot in range(12)]
+        self.ep = tuple([field >> 1 for field in edge_fields])
+        self.eo = tuple([field & 0b1 for field in edge_fields])
     
     def validate_state(self):
         """Validate the current cube state for consistency"""
-        # Check for duplicate edge positions
-        edge_positions = [e['position'] for e in self.edges]
-        if len(set(edge_positions)) != 12:
+        # Check every edge piece appears exactly once
+        if sorted(self.ep) != _EDGE_SLOTS:
             raise ValueError("Duplicate or missing edge positions detected!")
         
-        # Check for duplicate corner positions
-        corner_positions = [c['position'] for c in self.corners]
-        if len(set(corner_positions)) != 8:
+        # Check every corner piece appears exactly once
+        if sorted(self.cp) != _CORNER_SLOTS:
             raise ValueError("Duplicate or missing corner positions detected!")
         
         # Check edge orientation parity
-        edge_orientation_sum = sum(e['orientation'] for e in self.edges)
-        if edge_orientation_sum % 2 != 0:
+        edge_orientation_sum = sum(self.eo)
+        if edge_orientation_sum & 1:
             raise ValueError("Invalid edge orientation parity!")
         
         # Check corner orientation parity
-        corner_orientation_sum = sum(c['orientation'] for c in self.corners)
+        corner_orientation_sum = sum(self.co)
         if corner_orientation_sum % 3 != 0:
             raise ValueError("Invalid corner orientation parity!")
     
     def get_state_info(self):
         """Get detailed information about current cube state"""
         return {
-            'edges': copy.deepcopy(self.edges),
-            'corners': copy.deepcopy(self.corners),
+            'edges': self.edges,  # built fresh on every access, no copy needed
+            'corners': self.corners,
             'is_solved': self.is_cube_solved(),
-            'edge_orientations': [e['orientation'] for e in self.edges],
-            'corner_orientations': [c['orientation'] for c in self.corners]
+            'edge_orientations': list(self.eo),
+            'corner_orientations': list(self.co),
+            'packed_state': self.pack_state()
         }
 
+# Solved face colors for the letter-based Cube class, in its face order
+_CUBE_FACE_COLORS = (('DOWN', 'W'), ('FRONT', 'G'), ('LEFT', 'R'),
+                     ('RIGHT', 'O'), ('BACK', 'B'), ('UP', 'Y'))
+
 class Cube:
     """Enhanced Cube class with state tracking integration"""
     
@@ -195,320 +302,469 @@ class Cube:
             'R', 'G', 'B', 'Y', 'W', 'O'
         ]
 
-        '''
-            Initial Cube Setup
-        '''
-        self.state = {
-            'DOWN' : [
-                ['W', 'W', 'W'],
-                ['W', 'W', 'W'],
-                ['W', 'W', 'W']
-            ],
-            'FRONT' : [
-                ['G', 'G', 'G'],
-                ['G', 'G', 'G'],
-                ['G', 'G', 'G']
-            ],
-            'LEFT' : [
-                ['R', 'R', 'R'],
-                ['R', 'R', 'R'],
-                ['R', 'R', 'R']
-            ],
-            'RIGHT' : [
-                ['O', 'O', 'O'],
-                ['O', 'O', 'O'],
-                ['O', 'O', 'O']
-            ],
-            'BACK' : [
-                ['B', 'B', 'B'],
-                ['B', 'B', 'B'],
-                ['B', 'B', 'B']
-            ],
-            'UP' : [
-                ['Y', 'Y', 'Y'],
-                ['Y', 'Y', 'Y'],
-                ['Y', 'Y', 'Y']
-            ]
-        }
+        # Face layout is built on first access to state
+        self._state = None
         
         # Initialize the state tracker
         self.tracker = CubeStateTracker()
 
+    @property
+    def state(self):
+        """Initial Cube Setup - face name -> 3x3 list of color letters, built on first use"""
+        if self._state is None:
+            self._state = {face: [[color] * 3 for _ in range(3)] for face, color in _CUBE_FACE_COLORS}
+        return self._state
+    
+    @state.setter
+    def state(self, faces):
+        self._state = faces
+    
     def print(self) -> None:
         """Print cube state in unfolded format"""
-        for row in self.state['UP']:
+        state = self.state
+        for row in state['UP']:
             print(f"\t\t {row}")
         print()
         for i in range(3):
-            print(f"{self.state['LEFT'][i]}  {self.state['FRONT'][i]}  {self.state['RIGHT'][i]}  {self.state['BACK'][i]}")
+            print(f"{state['LEFT'][i]}  {state['FRONT'][i]}  {state['RIGHT'][i]}  {state['BACK'][i]}")
         print()
-        for row in self.state['DOWN']:
+        for row in state['DOWN']:
             print(f"\t\t {row}")
 
+# ============ MOVE TABLES ============
+#
+# Every move is a fixed permutation of the 6*N*N stickers. The ring-cycle turns
+# below are run once per cube size on a cube whose stickers are labelled with
+# their own flat index; the result is the permutation for that move. Applying a
+# move is then a single C-level gather over the flat sticker tuple.
+
+_SLICE_MOVES = ('M', 'E', 'S')
+# Move names are interned so table keys, history entries and parsed tokens share one object each
+_SCRAMBLE_MOVES = tuple(map(sys.intern, ('U', 'D', 'R', 'L', 'F', 'B', "U'", "D'", "R'", "L'", "F'", "B'")))
+
+# Scanner for run-together notation such as "RUR'U'" (spaced tokens skip it)
+_MOVE_RE = re.compile(r"[UDRLFBMES][2']?")
+
+def _rotate_clockwise(face):
+    """Rotate a face matrix 90 degrees clockwise"""
+    return [list(row) for row in zip(*face[::-1])]
+
+def _turn_U(cube, size):
+    """U turn - rotate Up face clockwise"""
+    # Rotate the Up face itself
+    cube[4] = _rotate_clockwise(cube[4])
+    
+    # Save the top row of Front face
+    temp = [cube[0][0][i] for i in range(size)]
+    
+    # Shift: Front <- Right <- Back <- Left <- Front
+    cube[0][0] = [cube[2][0][i] for i in range(size)]  # Front <- Right
+    cube[2][0] = [cube[1][0][i] for i in range(size)]  # Right <- Back  
+    cube[1][0] = [cube[3][0][i] for i in range(size)]  # Back <- Left
+    cube[3][0] = temp  # Left <- Front (saved)
+
+def _turn_D(cube, size):
+    """D turn - rotate Down face clockwise"""
+    # Rotate the Down face
+    cube[5] = _rotate_clockwise(cube[5])
+    
+    # Save bottom row of Front face
+    temp = [cube[0][size-1][i] for i in range(size)]
+    
+    # Shift: Front <- Left <- Back <- Right <- Front
+    cube[0][size-1] = [cube[3][size-1][i] for i in range(size)]  # Front <- Left
+    cube[3][size-1] = [cube[1][size-1][i] for i in range(size)]  # Left <- Back
+    cube[1][size-1] = [cube[2][size-1][i] for i in range(size)]  # Back <- Right
+    cube[2][size-1] = temp  # Right <- Front
+
+def _turn_R(cube, size):
+    """R turn - rotate Right face clockwise"""
+    # Rotate the Right face
+    cube[2] = _rotate_clockwise(cube[2])
+    
+    # Save right column of Front face
+    temp = [cube[0][i][size-1] for i in range(size)]
+    
+    # Shift right columns: Front <- Down <- Back <- Up <- Front
+    for i in range(size):
+        cube[0][i][size-1] = cube[5][i][size-1]      # Front <- Down
+        cube[5][i][size-1] = cube[1][size-1-i][0]    # Down <- Back (flipped)
+        cube[1][size-1-i][0] = cube[4][i][size-1]    # Back <- Up (flipped)
+        cube[4][i][size-1] = temp[i]                 # Up <- Front
+
+def _turn_L(cube, size):
+    """L turn - rotate Left face clockwise"""
+    # Rotate the Left face
+    cube[3] = _rotate_clockwise(cube[3])
+    
+    # Save left column of Front face
+    temp = [cube[0][i][0] for i in range(size)]
+    
+    # Shift left columns: Front <- Up <- Back <- Down <- Front
+    for i in range(size):
+        cube[0][i][0] = cube[4][i][0]                      # Front <- Up
+        cube[4][i][0] = cube[1][size-1-i][size-1]          # Up <- Back (flipped)
+        cube[1][size-1-i][size-1] = cube[5][i][0]          # Back <- Down (flipped)
+        cube[5][i][0] = temp[i]                            # Down <- Front
+
+def _turn_F(cube, size):
+    """F turn - rotate Front face clockwise"""
+    # Rotate the Front face
+    cube[0] = _rotate_clockwise(cube[0])
+    
+    # Save bottom row of Up face
+    temp = [cube[4][size-1][i] for i in range(size)]
+    
+    # Shift: Up <- Left <- Down <- Right <- Up
+    for i in range(size):
+        cube[4][size-1][i] = cube[3][size-1-i][size-1]    # Up <- Left (flipped)
+        cube[3][size-1-i][size-1] = cube[5][0][size-1-i]  # Left <- Down (flipped)
+        cube[5][0][size-1-i] = cube[2][i][0]              # Down <- Right (flipped)
+        cube[2][i][0] = temp[i]                           # Right <- Up
+
+def _turn_B(cube, size):
+    """B turn - rotate Back face clockwise"""
+    # Rotate the Back face
+    cube[1] = _rotate_clockwise(cube[1])
+    
+    # Save top row of Up face
+    temp = [cube[4][0][i] for i in range(size)]
+    
+    # Shift: Up <- Right <- Down <- Left <- Up
+    for i in range(size):
+        cube[4][0][i] = cube[2][i][size-1]                       # Up <- Right
+        cube[2][i][size-1] = cube[5][size-1][size-1-i]           # Right <- Down (flipped)
+        cube[5][size-1][size-1-i] = cube[3][size-1-i][0]         # Down <- Left
+        cube[3][size-1-i][0] = temp[i]                           # Left <- Up (flipped)
+
+def _turn_M(cube, size):
+    """M turn - middle slice (between L and R)"""
+    # For odd-sized cubes, rotate the middle slice
+    if size % 2 == 1:
+        middle = size // 2
+        # Save middle column of Front face
+        temp = [cube[0][i][middle] for i in range(size)]
+        
+        # Shift middle columns like L' move
+        for i in range(size):
+            cube[0][i][middle] = cube[4][i][middle]
+            cube[4][i][middle] = cube[1][size-1-i][middle]
+            cube[1][size-1-i][middle] = cube[5][i][middle]
+            cube[5][i][middle] = temp[i]
+
+def _turn_E(cube, size):
+    """E turn - equatorial slice (between U and D)"""
+    # For odd-sized cubes, rotate the middle slice
+    if size % 2 == 1:
+        middle = size // 2
+        # Save middle row of Front face
+        temp = [cube[0][middle][i] for i in range(size)]
+        
+        # Shift middle rows like D move
+        cube[0][middle] = [cube[3][middle][i] for i in range(size)]
+        cube[3][middle] = [cube[1][middle][i] for i in range(size)]
+        cube[1][middle] = [cube[2][middle][i] for i in range(size)]
+        cube[2][middle] = temp
+
+def _turn_S(cube, size):
+    """S turn - standing slice (between F and B)"""
+    # For odd-sized cubes, rotate the middle slice
+    if size % 2 == 1:
+        middle = size // 2
+        # Similar to F move but for middle slice
+        temp = [cube[4][middle][i] for i in range(size)]
+        
+        for i in range(size):
+            cube[4][middle][i] = cube[3][size-1-i][middle]
+            cube[3][size-1-i][middle] = cube[5][middle][size-1-i]
+            cube[5][middle][size-1-i] = cube[2][i][middle]
+            cube[2][i][middle] = temp[i]
+
+_TURNS = {
+    'U': _turn_U, 'D': _turn_D, 'R': _turn_R, 'L': _turn_L, 'F': _turn_F, 'B': _turn_B,
+    'M': _turn_M, 'E': _turn_E, 'S': _turn_S,
+}
+
+_MOVE_TABLES = {}
+
+def _get_move_tables(size):
+    """Return the {move: gather} permutation table for a cube size, built once per size"""
+    tables = _MOVE_TABLES.get(size)
+    if tables is not None:
+        return tables
+    
+    tables = {}
+    area = size * size
+    for face, turn in _TURNS.items():
+        if face in _SLICE_MOVES:
+            # Slice moves only exist for 3x3+ and have no prime/double variants
+            if size < 3:
+                continue
+            suffixes = ('',)
+        else:
+            suffixes = ('', '2', "'")
+        
+        # Label every sticker with its flat index, then turn 1, 2 and 3 times
+        labelled = [[[f*area + r*size + c for c in range(size)] for r in range(size)] for f in range(6)]
+        for suffix in suffixes:
+            turn(labelled, size)
+            perm = [index for f in labelled for row in f for index in row]
+            tables[sys.intern(face + suffix)] = itemgetter(*perm)
+    
+    _MOVE_TABLES[size] = tables
+    return tables
+
+@lru_cache(maxsize=256)
+def _fused_gather(size, moves):
+    """One gather equal to applying a fixed tuple of table moves in order, built once per algorithm"""
+    tables = _get_move_tables(size)
+    
+    # Push the sticker labels through every move; where each label lands is the fused permutation
+    indices = tuple(range(6 * size * size))
+    for move in moves:
+        indices = tables[move](indices)
+    return itemgetter(*indices)
+
+# Complexity rating per cube size; anything larger is "Master"
+_COMPLEXITY_RATINGS = {
+    1: "Trivial",
+    2: "Beginner",
+    3: "Standard",
+    4: "Advanced",
+    5: "Expert",
+}
+
+@lru_cache(maxsize=16)
+def _size_constants(size):
+    """(total pieces, complexity rating) for a cube size - fixed per size, computed once"""
+    if size == 1:
+        total_pieces = 6  # Just 6 center pieces
+    elif size == 2:
+        total_pieces = 8  # 8 corner pieces
+    elif size == 3:
+        total_pieces = 26  # 8 corners + 12 edges + 6 centers
+    else:
+        # For NxN cubes where N > 3
+        corners = 8
+        edges = 12 * (size - 2)
+        centers = 6 * ((size - 2) ** 2)
+        total_pieces = corners + edges + centers
+    return total_pieces, _COMPLEXITY_RATINGS.get(size, "Master")
+
+@lru_cache(maxsize=16)
+def _solved_stickers(size):
+    """Flat sticker tuple of a solved cube - shared by every cube of that size"""
+    return tuple(color for color in range(6) for _ in range(size * size))
+
 class RubiksCube:
     def __init__(self, size=3):
         """Initialize a solved Rubik's Cube of specified size"""
         self.size = size
+        self.num_stickers = 6 * size * size
         
         # Define color constants for each face
-        self.COLORS = {
-            0: 'WHITE',   # Front face
-            1: 'YELLOW',  # Back face  
-            2: 'RED',     # Right face
-            3: 'ORANGE',  # Left face
-            4: 'GREEN',   # Up face
-            5: 'BLUE'     # Down face
-        }
+        self.COLORS = dict(enumerate(COLOR_NAMES))
         
         # Face names for display
         self.FACE_NAMES = ['FRONT', 'BACK', 'RIGHT', 'LEFT', 'UP', 'DOWN']
         
+        # Stickers are stored as one flat tuple (face-major, then row, then column)
+        # and every move is a precomputed permutation of it
+        self._moves = _get_move_tables(size)
+        self._view = None
+        self._view_source = None
+        
+        # Bumped on every state change; derived results are cached per version
+        self._state_version = 0
+        self._solved_cache = (0, True)  # a new cube starts solved
+        self._diag_cache = None
+        self._info_cache = None
+        self._render_cache = None
+        self._state_bytes_cache = None
+        
         # Initialize the cube in solved state
-        self.cube = self.create_solved_cube()
+        self.stickers = _solved_stickers(size)
         self.move_history = []
-        
-        # Initialize state tracker for 3x3 cubes
-        if size == 3:
-            self.tracker = CubeStateTracker()
-        else:
-            self.tracker = None
+    
+    @cached_property
+    def tracker(self):
+        """State tracker for 3x3 cubes (None for other sizes), built on first use - at the latest by the first move"""
+        return CubeStateTracker() if self.size == 3 else None
     
     def create_solved_cube(self):
-        """Create a solved cube - each face has all same colors"""
-        cube = []
-        for face_color in range(6):
-            face = [[face_color for _ in range(self.size)] for _ in range(self.size)]
-            cube.append(face)
-        return cube
+        """Create a solved cube in nested [face][row][col] form - each face has all same colors"""
+        size = self.size
+        return [[[face_color] * size for _ in range(size)] for face_color in range(6)]
+    
+    @property
+    def cube(self):
+        """Nested [face][row][col] view of the stickers - read-only tuples, rebuilt after moves"""
+        if self._view_source is not self.stickers:
+            size = self.size
+            stickers = self.stickers
+            area = size * size
+            # Tuples, so an in-place write raises instead of drifting from the stickers
+            self._view = tuple(tuple(stickers[start:start + size]
+                                     for start in range(f * area, (f + 1) * area, size))
+                               for f in range(6))
+            self._view_source = stickers
+        return self._view
+    
+    @cube.setter
+    def cube(self, faces):
+        """Load stickers from a nested [face][row][col] list"""
+        self.stickers = tuple(cell for face in faces for row in face for cell in row)
+        self._state_version += 1
+    
+    def _nested_stickers(self):
+        """Build fresh nested [face][row][col] lists from the flat stickers"""
+        size = self.size
+        stickers = self.stickers
+        area = size * size
+        return [[list(stickers[start:start + size]) for start in range(f * area, (f + 1) * area, size)]
+                for f in range(6)]
     
     def copy_cube(self):
         """Create a deep copy of the current cube state"""
-        return copy.deepcopy(self.cube)
+        return self._nested_stickers()
+    
+    def get_checkpoint(self):
+        """Capture a lightweight snapshot (stickers, move history, packed tracker) for undo"""
+        tracker_state = self.tracker.pack_state() if self.tracker else None
+        return (self.stickers, tuple(self.move_history), tracker_state)
+    
+    def restore_checkpoint(self, checkpoint):
+        """Restore a snapshot taken with get_checkpoint"""
+        stickers, history, tracker_state = checkpoint
+        self.stickers = stickers
+        # The history may have been cleared since (e.g. by reset), so restore it whole
+        self.move_history[:] = history
+        if self.tracker and tracker_state is not None:
+            self.tracker.unpack_state(*tracker_state)
+        self._state_version += 1
     
     def rotate_face_clockwise(self, face):
         """Rotate a face matrix 90 degrees clockwise"""
-        size = len(face)
-        return [[face[size-1-j][i] for j in range(size)] for i in range(size)]
+        return _rotate_clockwise(face)
     
     def rotate_face_counterclockwise(self, face):
         """Rotate a face matrix 90 degrees counterclockwise"""
-        size = len(face)
-        return [[face[j][size-1-i] for j in range(size)] for i in range(size)]
+        return [list(row) for row in zip(*face)][::-1]
     
     # ============ BASIC MOVES ============
     
-    def move_U(self):
-        """Execute U move - rotate Up face clockwise"""
-        # Rotate the Up face itself
-        self.cube[4] = self.rotate_face_clockwise(self.cube[4])
-        
-        # Save the top row of Front face
-        temp = [self.cube[0][0][i] for i in range(self.size)]
-        
-        # Shift: Front <- Right <- Back <- Left <- Front
-        self.cube[0][0] = [self.cube[2][0][i] for i in range(self.size)]  # Front <- Right
-        self.cube[2][0] = [self.cube[1][0][i] for i in range(self.size)]  # Right <- Back  
-        self.cube[1][0] = [self.cube[3][0][i] for i in range(self.size)]  # Back <- Left
-        self.cube[3][0] = temp  # Left <- Front (saved)
-        
-        self.move_history.append('U')
+    def _apply_move(self, move):
+        """Apply a table move to the stickers, move history and 3x3 tracker"""
+        self.stickers = self._moves[move](self.stickers)
+        self.move_history.append(move)
+        self._state_version += 1
+        
+        # Update tracker for 3x3 cubes (slice moves are not tracked)
+        if self.tracker and move not in _SLICE_MOVES:
+            self.tracker.apply_move(move)
+    
+    def batch_apply(self, moves):
+        """Apply a list of table moves in one batch - every move must be valid for this size"""
+        tables = self._moves
+        getters = [tables[move] for move in moves]
+        
+        stickers = self.stickers
+        for getter in getters:
+            stickers = getter(stickers)
+        self.stickers = stickers
+        self._record_batch(moves)
+    
+    def apply_algorithm(self, moves):
+        """Apply a fixed tuple of table moves as one cached, fused sticker permutation"""
+        self.stickers = _fused_gather(self.size, moves)(self.stickers)
+        self._record_batch(moves)
+    
+    def _record_batch(self, moves):
+        """Record applied table moves in the move history and 3x3 tracker"""
+        self.move_history.extend(moves)
+        self._state_version += 1
         
-        # Update tracker for 3x3 cubes
         if self.tracker:
-            self.tracker.apply_move('U')
+            apply_tracker_move = self.tracker.apply_move
+            for move in moves:
+                if move not in _SLICE_MOVES:
+                    apply_tracker_move(move)
+    
+    def move_U(self):
+        """Execute U move - rotate Up face clockwise"""
+        self._apply_move('U')
     
     def move_D(self):
         """Execute D move - rotate Down face clockwise"""
-        # Rotate the Down face
-        self.cube[5] = self.rotate_face_clockwise(self.cube[5])
-        
-        # Save bottom row of Front face
-        temp = [self.cube[0][self.size-1][i] for i in range(self.size)]
-        
-        # Shift: Front <- Left <- Back <- Right <- Front
-        self.cube[0][self.size-1] = [self.cube[3][self.size-1][i] for i in range(self.size)]  # Front <- Left
-        self.cube[3][self.size-1] = [self.cube[1][self.size-1][i] for i in range(self.size)]  # Left <- Back
-        self.cube[1][self.size-1] = [self.cube[2][self.size-1][i] for i in range(self.size)]  # Back <- Right
-        self.cube[2][self.size-1] = temp  # Right <- Front
-        
-        self.move_history.append('D')
-        
-        # Update tracker for 3x3 cubes
-        if self.tracker:
-            self.tracker.apply_move('D')
+        self._apply_move('D')
     
     def move_R(self):
         """Execute R move - rotate Right face clockwise"""
-        # Rotate the Right face
-        self.cube[2] = self.rotate_face_clockwise(self.cube[2])
-        
-        # Save right column of Front face
-        temp = [self.cube[0][i][self.size-1] for i in range(self.size)]
-        
-        # Shift right columns: Front <- Down <- Back <- Up <- Front
-        for i in range(self.size):
-            self.cube[0][i][self.size-1] = self.cube[5][i][self.size-1]      # Front <- Down
-            self.cube[5][i][self.size-1] = self.cube[1][self.size-1-i][0]    # Down <- Back (flipped)
-            self.cube[1][self.size-1-i][0] = self.cube[4][i][self.size-1]    # Back <- Up (flipped)
-            self.cube[4][i][self.size-1] = temp[i]                           # Up <- Front
-        
-        self.move_history.append('R')
-        
-        # Update tracker for 3x3 cubes
-        if self.tracker:
-            self.tracker.apply_move('R')
+        self._apply_move('R')
     
     def move_L(self):
         """Execute L move - rotate Left face clockwise"""
-        # Rotate the Left face
-        self.cube[3] = self.rotate_face_clockwise(self.cube[3])
-        
-        # Save left column of Front face
-        temp = [self.cube[0][i][0] for i in range(self.size)]
-        
-        # Shift left columns: Front <- Up <- Back <- Down <- Front
-        for i in range(self.size):
-            self.cube[0][i][0] = self.cube[4][i][0]                      # Front <- Up
-            self.cube[4][i][0] = self.cube[1][self.size-1-i][self.size-1]    # Up <- Back (flipped)
-            self.cube[1][self.size-1-i][self.size-1] = self.cube[5][i][0]    # Back <- Down (flipped)
-            self.cube[5][i][0] = temp[i]                                 # Down <- Front
-        
-        self.move_history.append('L')
-        
-        # Update tracker for 3x3 cubes
-        if self.tracker:
-            self.tracker.apply_move('L')
+        self._apply_move('L')
     
     def move_F(self):
         """Execute F move - rotate Front face clockwise"""
-        # Rotate the Front face
-        self.cube[0] = self.rotate_face_clockwise(self.cube[0])
-        
-        # Save bottom row of Up face
-        temp = [self.cube[4][self.size-1][i] for i in range(self.size)]
-        
-        # Shift: Up <- Left <- Down <- Right <- Up
-        for i in range(self.size):
-            self.cube[4][self.size-1][i] = self.cube[3][self.size-1-i][self.size-1]    # Up <- Left (flipped)
-            self.cube[3][self.size-1-i][self.size-1] = self.cube[5][0][self.size-1-i]  # Left <- Down (flipped)
-            self.cube[5][0][self.size-1-i] = self.cube[2][i][0]                        # Down <- Right (flipped)
-            self.cube[2][i][0] = temp[i]                                               # Right <- Up
-        
-        self.move_history.append('F')
-        
-        # Update tracker for 3x3 cubes
-        if self.tracker:
-            self.tracker.apply_move('F')
+        self._apply_move('F')
     
     def move_B(self):
         """Execute B move - rotate Back face clockwise"""
-        # Rotate the Back face
-        self.cube[1] = self.rotate_face_clockwise(self.cube[1])
-        
-        # Save top row of Up face
-        temp = [self.cube[4][0][i] for i in range(self.size)]
-        
-        # Shift: Up <- Right <- Down <- Left <- Up
-        for i in range(self.size):
-            self.cube[4][0][i] = self.cube[2][self.size-1-i][self.size-1]           # Up <- Right (flipped)
-            self.cube[2][self.size-1-i][self.size-1] = self.cube[5][self.size-1][self.size-1-i]  # Right <- Down (flipped)
-            self.cube[5][self.size-1][self.size-1-i] = self.cube[3][i][0]           # Down <- Left (flipped)
-            self.cube[3][i][0] = temp[self.size-1-i]                                # Left <- Up (flipped)
-        
-        self.move_history.append('B')
-        
-        # Update tracker for 3x3 cubes
-        if self.tracker:
-            self.tracker.apply_move('B')
+        self._apply_move('B')
     
     # ============ PRIME MOVES (Counter-clockwise) ============
     
     def move_U_prime(self):
         """Execute U' move - rotate Up face counter-clockwise"""
-        for _ in range(3):
-            self.move_U()
-        # Fix move history
-        self.move_history = self.move_history[:-3]
-        self.move_history.append("U'")
+        self._apply_move("U'")
     
     def move_D_prime(self):
         """Execute D' move - rotate Down face counter-clockwise"""
-        for _ in range(3):
-            self.move_D()
-        self.move_history = self.move_history[:-3]
-        self.move_history.append("D'")
+        self._apply_move("D'")
     
     def move_R_prime(self):
         """Execute R' move - rotate Right face counter-clockwise"""
-        for _ in range(3):
-            self.move_R()
-        self.move_history = self.move_history[:-3]
-        self.move_history.append("R'")
+        self._apply_move("R'")
     
     def move_L_prime(self):
         """Execute L' move - rotate Left face counter-clockwise"""
-        for _ in range(3):
-            self.move_L()
-        self.move_history = self.move_history[:-3]
-        self.move_history.append("L'")
+        self._apply_move("L'")
     
     def move_F_prime(self):
         """Execute F' move - rotate Front face counter-clockwise"""
-        for _ in range(3):
-            self.move_F()
-        self.move_history = self.move_history[:-3]
-        self.move_history.append("F'")
+        self._apply_move("F'")
     
     def move_B_prime(self):
         """Execute B' move - rotate Back face counter-clockwise"""
-        for _ in range(3):
-            self.move_B()
-        self.move_history = self.move_history[:-3]
-        self.move_history.append("B'")
+        self._apply_move("B'")
     
     # ============ DOUBLE MOVES (180 degrees) ============
     
     def move_U2(self):
         """Execute U2 move - rotate Up face 180 degrees"""
-        self.move_U()
-        self.move_U()
-        self.move_history = self.move_history[:-2]
-        self.move_history.append("U2")
+        self._apply_move('U2')
     
     def move_D2(self):
         """Execute D2 move - rotate Down face 180 degrees"""
-        self.move_D()
-        self.move_D()
-        self.move_history = self.move_history[:-2]
-        self.move_history.append("D2")
+        self._apply_move('D2')
     
     def move_R2(self):
         """Execute R2 move - rotate Right face 180 degrees"""
-        self.move_R()
-        self.move_R()
-        self.move_history = self.move_history[:-2]
-        self.move_history.append("R2")
+        self._apply_move('R2')
     
     def move_L2(self):
         """Execute L2 move - rotate Left face 180 degrees"""
-        self.move_L()
-        self.move_L()
-        self.move_history = self.move_history[:-2]
-        self.move_history.append("L2")
+        self._apply_move('L2')
     
     def move_F2(self):
         """Execute F2 move - rotate Front face 180 degrees"""
-        self.move_F()
-        self.move_F()
-        self.move_history = self.move_history[:-2]
-        self.move_history.append("F2")
+        self._apply_move('F2')
     
     def move_B2(self):
         """Execute B2 move - rotate Back face 180 degrees"""
-        self.move_B()
-        self.move_B()
-        self.move_history = self.move_history[:-2]
-        self.move_history.append("B2")
+        self._apply_move('B2')
     
     # ============ SLICE MOVES (For 4x4+ cubes) ============
     
@@ -517,206 +773,185 @@ class RubiksCube:
         if self.size < 3:
             print("M move not applicable to 2x2 cube")
             return
-        
-        # For odd-sized cubes, rotate the middle slice
-        if self.size % 2 == 1:
-            middle = self.size // 2
-            # Save middle column of Front face
-            temp = [self.cube[0][i][middle] for i in range(self.size)]
-            
-            # Shift middle columns like L' move
-            for i in range(self.size):
-                self.cube[0][i][middle] = self.cube[4][i][middle]
-                self.cube[4][i][middle] = self.cube[1][self.size-1-i][middle]
-                self.cube[1][self.size-1-i][middle] = self.cube[5][i][middle]
-                self.cube[5][i][middle] = temp[i]
-        
-        self.move_history.append('M')
+        self._apply_move('M')
     
     def move_E(self):
         """Execute E move - equatorial slice (between U and D)"""
         if self.size < 3:
             print("E move not applicable to 2x2 cube")
             return
-        
-        # For odd-sized cubes, rotate the middle slice
-        if self.size % 2 == 1:
-            middle = self.size // 2
-            # Save middle row of Front face
-            temp = [self.cube[0][middle][i] for i in range(self.size)]
-            
-            # Shift middle rows like D move
-            self.cube[0][middle] = [self.cube[3][middle][i] for i in range(self.size)]
-            self.cube[3][middle] = [self.cube[1][middle][i] for i in range(self.size)]
-            self.cube[1][middle] = [self.cube[2][middle][i] for i in range(self.size)]
-            self.cube[2][middle] = temp
-        
-        self.move_history.append('E')
+        self._apply_move('E')
     
     def move_S(self):
         """Execute S move - standing slice (between F and B)"""
         if self.size < 3:
             print("S move not applicable to 2x2 cube")
             return
-        
-        # For odd-sized cubes, rotate the middle slice
-        if self.size % 2 == 1:
-            middle = self.size // 2
-            # Similar to F move but for middle slice
-            temp = [self.cube[4][middle][i] for i in range(self.size)]
-            
-            for i in range(self.size):
-                self.cube[4][middle][i] = self.cube[3][self.size-1-i][middle]
-                self.cube[3][self.size-1-i][middle] = self.cube[5][middle][self.size-1-i]
-                self.cube[5][middle][self.size-1-i] = self.cube[2][i][middle]
-                self.cube[2][i][middle] = temp[i]
-        
-        self.move_history.append('S')
+        self._apply_move('S')
     
     # ============ UTILITY METHODS ============
     
     def execute_moves(self, move_sequence):
         """Execute a sequence of moves from a string"""
-        moves = move_sequence.split()
-        
-        move_map = {
-            'U': self.move_U, "U'": self.move_U_prime, 'U2': self.move_U2,
-            'D': self.move_D, "D'": self.move_D_prime, 'D2': self.move_D2,
-            'R': self.move_R, "R'": self.move_R_prime, 'R2': self.move_R2,
-            'L': self.move_L, "L'": self.move_L_prime, 'L2': self.move_L2,
-            'F': self.move_F, "F'": self.move_F_prime, 'F2': self.move_F2,
-            'B': self.move_B, "B'": self.move_B_prime, 'B2': self.move_B2,
-            'M': self.move_M, 'E': self.move_E, 'S': self.move_S,
-        }
-        
-        for move in moves:
-            if move in move_map:
-                move_map[move]()
-            else:
-                print(f"Unknown move: {move}")
+        moves = self._moves
+        batch = []
+        
+        # History entries are interned so repeated moves share one string object
+        # and later dict/Counter lookups on them hit the identity fast path
+        for token in move_sequence.split():
+            if token in moves:
+                batch.append(sys.intern(token))
+                continue
+            
+            # One scan splits the token; it only counts if the pieces cover all of it
+            parts = _MOVE_RE.findall(token)
+            if sum(map(len, parts)) != len(token):
+                parts = [token]
+            for move in parts:
+                if move in moves:
+                    batch.append(sys.intern(move))
+                elif move in _SLICE_MOVES:
+                    print(f"{move} move not applicable to 2x2 cube")
+                else:
+                    print(f"Unknown move: {move}")
+        
+        if batch:
+            self.batch_apply(batch)
+    
+    def scramble(self, num_moves=20, rng=None, quiet=False):
+        """Scramble the cube with random moves (optionally from a shared random.Random), returning them"""
+        # Slice moves only exist for larger cubes
+        basic_moves = _SCRAMBLE_MOVES + _SLICE_MOVES if self.size >= 3 else _SCRAMBLE_MOVES
+        
+        # Draw the whole sequence in one call and apply it without re-tokenizing
+        scramble_sequence = (rng or random).choices(basic_moves, k=num_moves)
+        
+        if not quiet:
+            print(f"Scrambling {self.size}x{self.size}x{self.size} cube with {num_moves} moves: {' '.join(scramble_sequence)}")
+        self.batch_apply(scramble_sequence)
+        return scramble_sequence
     
-    def scramble(self, num_moves=20):
-        """Scramble the cube with random moves"""
-        basic_moves = ['U', 'D', 'R', 'L', 'F', 'B', "U'", "D'", "R'", "L'", "F'", "B'"]
+    def render_both(self):
+        """Render the detailed and compact views, reusing the cached text for a solved cube"""
+        if self.is_solved():
+            return _solved_renders(self.size)
+        
+        if self._render_cache and self._render_cache[0] == self._state_version:
+            return self._render_cache[1]
         
-        # Add slice moves for larger cubes
-        if self.size >= 3:
-            basic_moves.extend(['M', 'E', 'S'])
+        views = self._render_views()
+        self._render_cache = (self._state_version, views)
+        return views
+    
+    def _render_views(self):
+        """Render the detailed and compact views in one pass over the faces"""
+        n = self.size
+        face_letters = ['F', 'B', 'R', 'L', 'U', 'D']
         
-        scramble_sequence = []
-        for _ in range(num_moves):
-            move = random.choice(basic_moves)
-            scramble_sequence.append(move)
+        detailed = [f"\nCurrent {n}x{n}x{n} Cube State:", "=" * 50]
+        compact = [f"\n{n}x{n}x{n} Cube State (Compact):"]
         
-        print(f"Scrambling {self.size}x{self.size}x{self.size} cube with {num_moves} moves: {' '.join(scramble_sequence)}")
-        self.execute_moves(' '.join(scramble_sequence))
+        for i, face in enumerate(self.cube):
+            detailed.append(f"\n{self.FACE_NAMES[i]} Face ({self.COLORS[i]}):")
+            row_letters = [''.join([_COLOR_LETTERS[cell] for cell in row]) for row in face]
+            detailed.extend(['  ' + ' '.join(letters) for letters in row_letters])
+            compact.append(f"{face_letters[i]}: " + ''.join(row_letters))
+        
+        detailed.append("=" * 50)
+        detailed.append(f"Total stickers: {self.num_stickers}")
+        return '\n'.join(detailed), '\n'.join(compact)
+    
+    def render_detailed(self):
+        """Render the face-by-face view of the cube as a single string"""
+        return self.render_both()[0]
+    
+    def render_compact(self):
+        """Render the one-line-per-face view of the cube as a single string"""
+        return self.render_both()[1]
     
     def display_cube(self):
         """Display the current state of the cube"""
-        print(f"\nCurrent {self.size}x{self.size}x{self.size} Cube State:")
-        print("=" * 50)
-        
-        for i, face in enumerate(self.cube):
-            print(f"\n{self.FACE_NAMES[i]} Face ({self.COLORS[i]}):")
-            for row in face:
-                display_row = [self.COLORS[cell][0] for cell in row]
-                print('  ' + ' '.join(display_row))
-        
-        print("=" * 50)
-        print(f"Total stickers: {6 * self.size * self.size}")
+        print(self.render_detailed())
     
     def display_cube_compact(self):
         """Display cube in a more compact format"""
-        face_letters = ['F', 'B', 'R', 'L', 'U', 'D']
-        
-        print(f"\n{self.size}x{self.size}x{self.size} Cube State (Compact):")
-        for i, face in enumerate(self.cube):
-            print(f"{face_letters[i]}: ", end="")
-            for row in face:
-                for cell in row:
-                    print(self.COLORS[cell][0], end="")
-            print()
+        print(self.render_compact())
     
     def is_solved(self):
         """Check if the cube is in solved state"""
-        for face_idx, face in enumerate(self.cube):
-            for row in face:
-                for cell in row:
-                    if cell != face_idx:
-                        return False
-        return True
+        if self._solved_cache and self._solved_cache[0] == self._state_version:
+            return self._solved_cache[1]
+        
+        # Solved means every face shows its own color, i.e. the per-size solved layout
+        solved = self.stickers == _solved_stickers(self.size)
+        self._solved_cache = (self._state_version, solved)
+        return solved
+    
+    def get_color_counts(self):
+        """Count stickers of each color id in a single pass"""
+        return Counter(self.stickers)
     
     def get_state_string(self):
         """Get a string representation of the cube state"""
-        state = ""
-        for face in self.cube:
-            for row in face:
-                for cell in row:
-                    state += str(cell)
-        return state
+        # One digit per sticker, translated from the cached state bytes
+        return self.state_bytes().translate(_STICKER_DIGITS).decode('ascii')
+    
+    def state_bytes(self):
+        """Get the stickers as a compact bytes value (one byte per sticker) - the key for state lookups"""
+        if self._state_bytes_cache and self._state_bytes_cache[0] == self._state_version:
+            return self._state_bytes_cache[1]
+        
+        key = bytes(self.stickers)
+        self._state_bytes_cache = (self._state_version, key)
+        return key
     
     def reset(self):
         """Reset cube to solved state"""
-        self.cube = self.create_solved_cube()
+        self.stickers = _solved_stickers(self.size)
         self.move_history = []
         
         # Reset tracker for 3x3 cubes
         if self.tracker:
-            self.tracker = CubeStateTracker()
+            self.tracker.reset()
+        self._state_version += 1
+        self._solved_cache = (self._state_version, True)
     
     def get_cube_info(self):
         """Get information about the current cube"""
-        return {
+        if self._info_cache and self._info_cache[0] == self._state_version:
+            return self._info_cache[1]
+        
+        total_pieces, complexity = _size_constants(self.size)
+        info = {
             'size': self.size,
-            'total_stickers': 6 * self.size * self.size,
-            'total_pieces': self.calculate_total_pieces(),
+            'total_stickers': self.num_stickers,
+            'total_pieces': total_pieces,
             'is_solved': self.is_solved(),
             'move_count': len(self.move_history),
-            'complexity': self.get_complexity_rating(),
+            'complexity': complexity,
             'has_tracker': self.tracker is not None
         }
+        self._info_cache = (self._state_version, info)
+        return info
     
     def calculate_total_pieces(self):
         """Calculate total number of pieces based on cube size"""
-        if self.size == 1:
-            return 6  # Just 6 center pieces
-        elif self.size == 2:
-            return 8  # 8 corner pieces
-        elif self.size == 3:
-            return 26  # 8 corners + 12 edges + 6 centers
-        else:
-            # For NxN cubes where N > 3
-            corners = 8
-            edges = 12 * (self.size - 2)
-            centers = 6 * ((self.size - 2) ** 2)
-            return corners + edges + centers
+        return _size_constants(self.size)[0]
     
     def get_complexity_rating(self):
         """Get a complexity rating for the current cube size"""
-        complexity_map = {
-            1: "Trivial",
-            2: "Beginner",
-            3: "Standard",
-            4: "Advanced",
-            5: "Expert",
-        }
-        
-        if self.size <= 5:
-            return complexity_map[self.size]
-        else:
-            return "Master"
+        return _size_constants(self.size)[1]
     
     def clone(self):
         """Create a complete copy of this cube"""
         new_cube = RubiksCube(size=self.size)
-        new_cube.cube = copy.deepcopy(self.cube)
+        new_cube.stickers = self.stickers  # immutable tuple, safe to share
+        new_cube._state_version += 1
         new_cube.move_history = self.move_history.copy()
         
-        # Clone tracker if it exists
+        # Clone tracker if it exists - its state tuples are immutable, so a shallow copy is independent
         if self.tracker:
-            new_cube.tracker = CubeStateTracker()
-            new_cube.tracker.edges = copy.deepcopy(self.tracker.edges)
-            new_cube.tracker.corners = copy.deepcopy(self.tracker.corners)
+            new_cube.tracker = copy.copy(self.tracker)
         
         return new_cube
     
@@ -728,17 +963,22 @@ class RubiksCube:
                 'message': 'State tracking only available for 3x3 cubes'
             }
         
-        return {
+        if self._diag_cache and self._diag_cache[0] == self._state_version:
+            return self._diag_cache[1]
+        
+        diagnostics = {
             'has_tracker': True,
-            'edge_positions': [e['position'] for e in self.tracker.edges],
-            'edge_orientations': [e['orientation'] for e in self.tracker.edges],
-            'corner_positions': [c['position'] for c in self.tracker.corners],
-            'corner_orientations': [c['orientation'] for c in self.tracker.corners],
-            'solved_edges': sum(1 for i in range(12) if self.tracker.is_edge_solved(i)),
-            'solved_corners': sum(1 for i in range(8) if self.tracker.is_corner_solved(i)),
+            'edge_positions': list(self.tracker.ep),
+            'edge_orientations': list(self.tracker.eo),
+            'corner_positions': list(self.tracker.cp),
+            'corner_orientations': list(self.tracker.co),
+            'solved_edges': self.tracker.count_solved_edges(),
+            'solved_corners': self.tracker.count_solved_corners(),
             'tracker_solved': self.tracker.is_cube_solved(),
             'validation_status': self.validate_cube_state()
         }
+        self._diag_cache = (self._state_version, diagnostics)
+        return diagnostics
     
     def validate_cube_state(self):
         """Validate current cube state using tracker"""
@@ -753,77 +993,104 @@ class RubiksCube:
         except Exception as e:
             return {'valid': False, 'message': f'Validation error: {e}'}
 
+@lru_cache(maxsize=16)
+def _solved_renders(size):
+    """Detailed and compact views of a solved cube - identical after every solve"""
+    return RubiksCube(size=size)._render_views()
+
 # Utility functions for cube operations
 def create_multiple_cubes(sizes):
     """Create multiple cubes of different sizes"""
     cubes = {}
     for size in sizes:
-        try:
-            cubes[size] = RubiksCube(size=size)
-            print(f"✓ Created {size}x{size}x{size} cube")
-        except Exception as e:
-            print(f"✗ Failed to create {size}x{size}x{size} cube: {e}")
+        label = f"{size}x{size}x{size}"
+        # The only invalid input is a size that isn't a positive whole number
+        if isinstance(size, bool) or not isinstance(size, int) or size < 1:
+            print(f"✗ Failed to create {label} cube: size must be a positive integer")
+            continue
+        cubes[size] = RubiksCube(size=size)
+        print(f"✓ Created {label} cube")
     return cubes
 
 def compare_cube_states(cube1, cube2):
     """Compare two cubes and return if they're identical"""
-    if cube1.size != cube2.size:
-        return False
-    return cube1.get_state_string() == cube2.get_state_string()
+    return cube1.size == cube2.size and cube1.state_bytes() == cube2.state_bytes()
 
 # Testing and demonstration functions
-def test_cube_functionality():
-    """Test basic cube functionality across different sizes"""
-    print("=== Testing Multi-Size Cube Functionality ===")
-    
-    for size in [2, 3, 4]:
-        print(f"\nTesting {size}x{size}x{size} cube:")
-        cube = RubiksCube(size=size)
-        
-        # Test basic properties
-        assert cube.is_solved(), "New cube should be solved"
-        print(f"✓ {size}x{size}x{size} cube initializes as solved")
-        
-        # Test basic move
-        cube.move_U()
-        assert not cube.is_solved(), "Cube should not be solved after move"
-        print(f"✓ {size}x{size}x{size} cube changes state after U move")
-        
-        # Test move history
-        assert len(cube.move_history) == 1, "Move history should track moves"
-        print(f"✓ {size}x{size}x{size} cube tracks move history")
-        
-        # Test tracker for 3x3
-        if size == 3:
-            assert cube.tracker is not None, "3x3 cube should have tracker"
-            print(f"✓ {size}x{size}x{size} cube has state tracker")
-        
-        # Test reset
-        cube.reset()
-        assert cube.is_solved(), "Cube should be solved after reset"
-        print(f"✓ {size}x{size}x{size} cube resets correctly")
-    
-    print("\n✓ All tests passed! Multi-size cube functionality working correctly.")
+def test_cube_functionality(verbose=False):
+    """Test basic cube functionality across different sizes (per-check output only when verbose)"""
+    # Output is collected and written once; a failing assert still flushes what ran
+    out = []
+    log = out.append if verbose else (lambda line: None)
+    try:
+        log("=== Testing Multi-Size Cube Functionality ===")
+        
+        for size in [2, 3, 4]:
+            label = f"{size}x{size}x{size}"
+            log(f"\nTesting {label} cube:")
+            cube = RubiksCube(size=size)
+            
+            # Test basic properties
+            assert cube.is_solved(), "New cube should be solved"
+            log(f"✓ {label} cube initializes as solved")
+            
+            # Test basic move
+            cube.move_U()
+            assert not cube.is_solved(), "Cube should not be solved after move"
+            log(f"✓ {label} cube changes state after U move")
+            
+            # Test move history
+            assert len(cube.move_history) == 1, "Move history should track moves"
+            log(f"✓ {label} cube tracks move history")
+            
+            # Test tracker for 3x3
+            if size == 3:
+                assert cube.tracker is not None, "3x3 cube should have tracker"
+                log(f"✓ {label} cube has state tracker")
+            
+            # Test reset
+            cube.reset()
+            assert cube.is_solved(), "Cube should be solved after reset"
+            log(f"✓ {label} cube resets correctly")
+        
+        out.append("\n✓ All tests passed! Multi-size cube functionality working correctly.")
+    finally:
+        if out:
+            sys.stdout.write('\n'.join(out) + '\n')
 
-if __name__ == "__main__":
-    # Run tests when file is executed directly
-    test_cube_functionality()
-    
-    # Demo different cube sizes
-    print("\n=== Multi-Size Cube Demo ===")
+def _run_demo():
+    """Demo different cube sizes"""
+    out = ["\n=== Multi-Size Cube Demo ==="]
     for size in [2, 3, 4]:
-        print(f"\nCreating {size}x{size}x{size} cube:")
+        label = f"{size}x{size}x{size}"
+        out.append(f"\nCreating {label} cube:")
         cube = RubiksCube(size=size)
         info = cube.get_cube_info()
-        print(f"  Size: {info['size']}x{info['size']}x{info['size']}")
-        print(f"  Total stickers: {info['total_stickers']}")
-        print(f"  Total pieces: {info['total_pieces']}")
-        print(f"  Complexity: {info['complexity']}")
-        print(f"  Solved: {info['is_solved']}")
-        print(f"  Has tracker: {info['has_tracker']}")
+        out.append(f"  Size: {label}")
+        out.append(f"  Total stickers: {info['total_stickers']}")
+        out.append(f"  Total pieces: {info['total_pieces']}")
+        out.append(f"  Complexity: {info['complexity']}")
+        out.append(f"  Solved: {info['is_solved']}")
+        out.append(f"  Has tracker: {info['has_tracker']}")
         
         # Test tracker diagnostics for 3x3
         if size == 3:
             diagnostics = cube.get_tracker_diagnostics()
-            print(f"  Tracker solved edges: {diagnostics['solved_edges']}/12")
-            print(f"  Tracker solved corners: {diagnostics['solved_corners']}/8")
\ No newline at end of file
+            out.append(f"  Tracker solved edges: {diagnostics['solved_edges']}/12")
+            out.append(f"  Tracker solved corners: {diagnostics['solved_corners']}/8")
+    sys.stdout.write('\n'.join(out) + '\n')
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Multi-size Rubik's cube self-test and demo")
+    parser.add_argument('--test', action='store_true', help="run the functionality tests")
+    parser.add_argument('--demo', action='store_true', help="run the multi-size demo")
+    args = parser.parse_args()
+    
+    # With no flags, run both as before
+    run_all = not (args.test or args.demo)
+    if args.test or run_all:
+        test_cube_functionality(verbose=True)
+    if args.demo or run_all:
+        _run_demo()
@@ -2,16 +2,351 @@
 State-Driven Rubik's Cube Solver Implementation
 True Layer-by-Layer (LBL) method with precise state analysis
 Uses RubiksCube and CubeStateTracker for accurate piece tracking
+Uses the Kociemba two-phase C extension first when it is installed
 """
 
-from rubiks_cube import RubiksCube, CubeStateTracker
+from rubiks_cube import RubiksCube, CubeStateTracker, WHITE, YELLOW, RED, ORANGE, GREEN, BLUE
+from functools import lru_cache
+from operator import getitem, itemgetter
 import copy
+import sys
+
+try:
+    import kociemba
+    KOCIEMBA_AVAILABLE = True
+except ImportError:
+    KOCIEMBA_AVAILABLE = False
+
+# Kociemba facelet strings list faces as U R F D L B; these are our face indices
+FACELET_FACE_ORDER = (4, 2, 0, 5, 3, 1)
+
+# Slice moves carry centers between faces: new_centers[face] = old_centers[source[face]]
+SLICE_CENTER_SOURCES = {
+    'M': (4, 5, 2, 3, 1, 0),  # Front <- Up <- Back <- Down <- Front
+    'E': (3, 2, 0, 1, 4, 5),  # Front <- Left <- Back <- Right <- Front
+    'S': (0, 1, 4, 5, 3, 2),  # Up <- Left <- Down <- Right <- Up
+}
+
+# Names of the solving methods, as recorded in RubiksCubeSolver.solve_method
+SOLVE_METHOD_TWO_PHASE = "Two-Phase (Kociemba)"
+SOLVE_METHOD_IDA_STAR = "IDA*"
+SOLVE_METHOD_LBL = "Layer-by-Layer"
+
+SOLVED_FACELETS = 'U' * 9 + 'R' * 9 + 'F' * 9 + 'D' * 9 + 'L' * 9 + 'B' * 9
+
+def _flat(face, row, col):
+    """Index of a 3x3 sticker in the cube's flat sticker tuple"""
+    return face * 9 + row * 3 + col
+
+@lru_cache(maxsize=256)
+def _parse_algorithm(algorithm):
+    """Split an algorithm string into interned move tokens, once per distinct literal"""
+    return tuple(map(sys.intern, algorithm.split()))
+
+# ============ LBL LOCATION TABLES ============
+#
+# Sticker locations are (face, row, col) with the face indices used by RubiksCube.
+# The tables are fixed for a 3x3, so they are built once here instead of on every call.
+
+FRONT, BACK, RIGHT, LEFT, UP, DOWN = range(6)
+
+# Every edge as (sticker, sticker) locations
+_TOP_EDGE_LOCATIONS = (
+    ((UP, 0, 1), (BACK, 0, 1)),   # Up-Back
+    ((UP, 1, 2), (RIGHT, 0, 1)),  # Up-Right
+    ((UP, 2, 1), (FRONT, 0, 1)),  # Up-Front
+    ((UP, 1, 0), (LEFT, 0, 1)),   # Up-Left
+)
+_BOTTOM_EDGE_LOCATIONS = (
+    ((DOWN, 0, 1), (FRONT, 2, 1)),  # Down-Front
+    ((DOWN, 1, 2), (RIGHT, 2, 1)),  # Down-Right
+    ((DOWN, 2, 1), (BACK, 2, 1)),   # Down-Back
+    ((DOWN, 1, 0), (LEFT, 2, 1)),   # Down-Left
+)
+_MIDDLE_EDGE_LOCATIONS = (
+    ((FRONT, 1, 0), (LEFT, 1, 2)),   # Front-Left
+    ((FRONT, 1, 2), (RIGHT, 1, 0)),  # Front-Right
+    ((BACK, 1, 0), (RIGHT, 1, 2)),   # Back-Right
+    ((BACK, 1, 2), (LEFT, 1, 0)),    # Back-Left
+)
+_EDGE_LOCATIONS = _TOP_EDGE_LOCATIONS + _BOTTOM_EDGE_LOCATIONS + _MIDDLE_EDGE_LOCATIONS
+_MIDDLE_SEARCH_LOCATIONS = _TOP_EDGE_LOCATIONS + _MIDDLE_EDGE_LOCATIONS
+
+# Every corner as (sticker, sticker, sticker) locations
+_TOP_CORNER_LOCATIONS = (
+    ((UP, 2, 2), (FRONT, 0, 2), (RIGHT, 0, 0)),  # UFR
+    ((UP, 2, 0), (FRONT, 0, 0), (LEFT, 0, 2)),   # UFL
+    ((UP, 0, 0), (BACK, 0, 2), (LEFT, 0, 0)),    # UBL
+    ((UP, 0, 2), (BACK, 0, 0), (RIGHT, 0, 2)),   # UBR
+)
+_BOTTOM_CORNER_LOCATIONS = (
+    ((DOWN, 0, 2), (FRONT, 2, 2), (RIGHT, 2, 0)),  # DFR
+    ((DOWN, 0, 0), (FRONT, 2, 0), (LEFT, 2, 2)),   # DFL
+    ((DOWN, 2, 0), (BACK, 2, 2), (LEFT, 2, 0)),    # DBL
+    ((DOWN, 2, 2), (BACK, 2, 0), (RIGHT, 2, 2)),   # DBR
+)
+_CORNER_LOCATIONS = _TOP_CORNER_LOCATIONS + _BOTTOM_CORNER_LOCATIONS
+
+# Target colors per slot, in the same order as the sticker locations
+_WHITE_EDGE_COLORS = (
+    (WHITE, GREEN),   # Down-Front: White-Green
+    (WHITE, RED),     # Down-Right: White-Red
+    (WHITE, BLUE),    # Down-Back: White-Blue
+    (WHITE, ORANGE),  # Down-Left: White-Orange
+)
+_WHITE_CORNER_COLORS = (
+    (WHITE, GREEN, RED),     # DFR
+    (WHITE, GREEN, ORANGE),  # DFL
+    (WHITE, BLUE, ORANGE),   # DBL
+    (WHITE, BLUE, RED),      # DBR
+)
+_MIDDLE_EDGE_COLORS = (
+    (GREEN, ORANGE),  # Front-Left
+    (GREEN, RED),     # Front-Right
+    (BLUE, RED),      # Back-Right
+    (BLUE, ORANGE),   # Back-Left
+)
+
+# The same tables as flat sticker indices, so the piece checks index the sticker tuple directly
+def _flat_indices(locations):
+    """Flat sticker indices for a table of piece locations"""
+    return tuple(tuple(_flat(*pos) for pos in location) for location in locations)
+
+_EDGE_INDICES = _flat_indices(_EDGE_LOCATIONS)
+_BOTTOM_EDGE_INDICES = _flat_indices(_BOTTOM_EDGE_LOCATIONS)
+_MIDDLE_EDGE_INDICES = _flat_indices(_MIDDLE_EDGE_LOCATIONS)
+_MIDDLE_SEARCH_INDICES = _flat_indices(_MIDDLE_SEARCH_LOCATIONS)
+_TOP_EDGE_INDICES = _flat_indices(_TOP_EDGE_LOCATIONS)
+_CORNER_INDICES = _flat_indices(_CORNER_LOCATIONS)
+_TOP_CORNER_INDICES = _flat_indices(_TOP_CORNER_LOCATIONS)
+_BOTTOM_CORNER_INDICES = _flat_indices(_BOTTOM_CORNER_LOCATIONS)
+
+# Layer slot index (0-3) of the sticker a piece shows on the Up/Down face
+_TOP_EDGE_INDEX = {(UP, 2, 1): 0, (UP, 1, 2): 1, (UP, 0, 1): 2, (UP, 1, 0): 3}  # F, R, B, L
+_BOTTOM_EDGE_INDEX = {(DOWN, 0, 1): 0, (DOWN, 1, 2): 1, (DOWN, 2, 1): 2, (DOWN, 1, 0): 3}  # F, R, B, L
+_TOP_CORNER_INDEX = {(UP, 2, 2): 0, (UP, 2, 0): 1, (UP, 0, 0): 2, (UP, 0, 2): 3}  # FR, FL, BL, BR
+_BOTTOM_CORNER_INDEX = {(DOWN, 0, 2): 0, (DOWN, 0, 0): 1, (DOWN, 2, 0): 2, (DOWN, 2, 2): 3}  # FR, FL, BL, BR
+
+# Half turn of the side face for each Down/Up edge slot (front, right, back, left)
+_HALF_TURNS = ("F2", "R2", "B2", "L2")
+
+# Lifts a corner out of each Down slot (front-right, front-left, back-left, back-right)
+_BOTTOM_CORNER_EXTRACTS = ("R' D' R D", "L D L' D'", "L' D' L D", "R D R' D'")
+
+# UFR corner stickers checked for white, in priority order: top, front, right
+_UFR_STICKERS = itemgetter(_flat(UP, 2, 2), _flat(FRONT, 0, 2), _flat(RIGHT, 0, 0))
+
+# Face showing white, indexed by top | front << 1 | right << 2 "is white" bits (first one wins)
+_UFR_WHITE_FACE = tuple(
+    "top" if bits & 1 or not bits else "front" if bits & 2 else "right"
+    for bits in range(8)
+)
+
+# FR corner insertion algorithm for each face the white sticker can show on
+_FR_CORNER_INSERTS = {
+    "right": "R' D' R D",
+    "front": "F D F' D' D' R' D' R",
+    "top": "R' D2 R D R' D' R",
+}
+
+
+def _color_mask(*colors):
+    """Bitmask of a piece's sticker colors, one bit per color"""
+    mask = 0
+    for color in colors:
+        mask |= 1 << color
+    return mask
+
+
+# Pieces are matched by color mask, which compares the same as a set of the colors
+_WHITE_EDGE_MASKS = tuple(_color_mask(*colors) for colors in _WHITE_EDGE_COLORS)
+_WHITE_CORNER_MASKS = tuple(_color_mask(*colors) for colors in _WHITE_CORNER_COLORS)
+_MIDDLE_EDGE_MASKS = tuple(_color_mask(*colors) for colors in _MIDDLE_EDGE_COLORS)
+
+# Last layer slots checked for permutation, with the color mask each should hold
+_LAST_LAYER_CORNERS = (
+    (_TOP_CORNER_INDICES[2], _color_mask(YELLOW, BLUE, ORANGE)),   # UBL
+    (_TOP_CORNER_INDICES[3], _color_mask(YELLOW, BLUE, RED)),      # UBR
+    (_TOP_CORNER_INDICES[1], _color_mask(YELLOW, GREEN, ORANGE)),  # UFL
+    (_TOP_CORNER_INDICES[0], _color_mask(YELLOW, GREEN, RED)),     # UFR
+)
+_LAST_LAYER_EDGES = (
+    (_TOP_EDGE_INDICES[0], _color_mask(YELLOW, BLUE)),    # UB
+    (_TOP_EDGE_INDICES[1], _color_mask(YELLOW, RED)),     # UR
+    (_TOP_EDGE_INDICES[2], _color_mask(YELLOW, GREEN)),   # UF
+    (_TOP_EDGE_INDICES[3], _color_mask(YELLOW, ORANGE)),  # UL
+)
+
+def load_two_phase_tables():
+    """Load the two-phase pruning tables into this process ahead of the first solve
+    
+    The C extension reads its tables from disk into process memory on first use.
+    Calling this before starting worker processes only helps with the fork start
+    method, where workers share the parent's read-only pages copy-on-write; under
+    spawn (the macOS and Windows default) every worker loads its own copy.
+    """
+    if not KOCIEMBA_AVAILABLE:
+        return False
+    kociemba.solve(SOLVED_FACELETS)
+    return True
+
+# ============ IDA* PATTERN DATABASES ============
+#
+# Solvers created with use_ida_star=True look for short optimal solutions by IDA* search
+# over face turns before falling back to LBL.
+# Each pattern database maps a projection of the cube (some stickers, with colors merged
+# into classes) to the fewest face turns that solve it, found by breadth-first search from
+# the solved projection. A projection never needs more moves than the whole cube, so the
+# largest distance over all databases is an admissible heuristic.
+
+IDA_MAX_DEPTH = 12
+IDA_NODE_BUDGET = 20000
+
+IDA_FACE_TURNS = tuple(sys.intern(face + suffix) for face in 'UDRLFB' for suffix in ('', "'", '2'))
+
+# Opposite faces commute, so after a turn only the other faces are tried, and of an
+# opposite pair only the order with the earlier face (in UDRLFB order) first
+_IDA_FACE_ORDER = {face: i for i, face in enumerate('UDRLFB')}
+_IDA_OPPOSITE = {'U': 'D', 'D': 'U', 'R': 'L', 'L': 'R', 'F': 'B', 'B': 'F'}
+_IDA_NEXT_MOVES = {
+    last: tuple(move for move in IDA_FACE_TURNS
+                if move[0] != last and not (move[0] == _IDA_OPPOSITE[last] and
+                                            _IDA_FACE_ORDER[move[0]] < _IDA_FACE_ORDER[last]))
+    for last in 'UDRLFB'
+}
+_IDA_NEXT_MOVES[None] = IDA_FACE_TURNS
+
+# Solved stickers once slice-displaced centers are home: every face shows its own index
+_IDA_GOAL = tuple(face for face in range(6) for _ in range(9))
+
+_CORNER_STICKERS = tuple(face * 9 + i for face in range(6) for i in (0, 2, 6, 8))
+_EDGE_STICKERS = tuple(face * 9 + i for face in range(6) for i in (1, 3, 5, 7))
+
+# (sticker positions, class of each face's color): Up/Down corners with their twist, and the
+# edges carrying each axis's colors with their flips
+_IDA_PATTERNS = (
+    (_CORNER_STICKERS, (0, 0, 0, 0, 1, 2)),
+    (_EDGE_STICKERS, (0, 0, 0, 0, 1, 1)),
+    (_EDGE_STICKERS, (1, 1, 0, 0, 0, 0)),
+    (_EDGE_STICKERS, (0, 0, 1, 1, 0, 0)),
+)
+
+def _face_turn_permutations():
+    """Sticker permutation of every face turn, read off a probe cube labelled 0..53"""
+    probe = RubiksCube(3)
+    perms = {}
+    for move in IDA_FACE_TURNS:
+        probe.stickers = tuple(range(54))
+        probe.batch_apply([move])
+        perms[move] = probe.stickers
+    return perms
+
+def _build_pattern_database(perms, positions, classes):
+    """Per-move gathers on the projected stickers and the {projection: distance} table"""
+    slot = {position: i for i, position in enumerate(positions)}
+    gathers = {move: itemgetter(*[slot[perm[position]] for position in positions])
+               for move, perm in perms.items()}
+    
+    solved = tuple(classes[position // 9] for position in positions)
+    distances = {solved: 0}
+    frontier = [solved]
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for pattern in frontier:
+            for gather in gathers.values():
+                moved = gather(pattern)
+                if moved not in distances:
+                    distances[moved] = depth
+                    next_frontier.append(moved)
+        frontier = next_frontier
+    
+    return gathers, distances
+
+@lru_cache(maxsize=1)
+def load_pattern_databases():
+    """Build the IDA* move gathers and pattern databases, once per process
+    
+    Building them takes several seconds and ~150 MB. Calling this before starting
+    worker processes only helps with the fork start method, where workers share
+    the parent's tables copy-on-write; under spawn (the macOS and Windows
+    default) every worker that opts into IDA* rebuilds its own copy.
+    """
+    perms = _face_turn_permutations()
+    move_gathers = {move: itemgetter(*perm) for move, perm in perms.items()}
+    databases = tuple(_build_pattern_database(perms, positions, classes)
+                      for positions, classes in _IDA_PATTERNS)
+    return move_gathers, databases
+
+def _ida_star_search(stickers, max_depth=IDA_MAX_DEPTH, node_budget=IDA_NODE_BUDGET):
+    """Shortest face-turn solution for stickers with centers home, or None past the depth/node limits"""
+    move_gathers, databases = load_pattern_databases()
+    distance_tables = tuple(distances for _, distances in databases)
+    pattern_gathers = {move: tuple(gathers[move] for gathers, _ in databases)
+                       for move in IDA_FACE_TURNS}
+    
+    path = []
+    nodes = 0
+    
+    def search(state, patterns, depth, bound, last_face):
+        """True once solved, None when out of budget, else the smallest estimate over bound"""
+        nonlocal nodes
+        estimate = max(map(getitem, distance_tables, patterns))
+        if estimate == 0 and state == _IDA_GOAL:
+            return True
+        if depth + estimate > bound:
+            return depth + estimate
+        
+        nodes += 1
+        if nodes > node_budget:
+            return None
+        
+        next_bound = max_depth + 1
+        for move in _IDA_NEXT_MOVES[last_face]:
+            gathers = pattern_gathers[move]
+            path.append(move)
+            result = search(move_gathers[move](state),
+                            tuple(gather(pattern) for gather, pattern in zip(gathers, patterns)),
+                            depth + 1, bound, move[0])
+            if result is True or result is None:
+                return result
+            path.pop()
+            next_bound = min(next_bound, result)
+        return next_bound
+    
+    # Iterative deepening on the estimate bound; the recursion is at most max_depth deep
+    patterns = tuple(tuple(classes[stickers[position]] for position in positions)
+                     for positions, classes in _IDA_PATTERNS)
+    bound = max(map(getitem, distance_tables, patterns))
+    while bound <= max_depth:
+        result = search(stickers, patterns, 0, bound, None)
+        if result is True:
+            return path
+        if result is None:
+            return None
+        bound = result
+    return None
 
 class RubiksCubeSolver:
     """State-driven Rubik's Cube Solver with precise LBL implementation"""
     
-    def __init__(self, cube):
-        """Initialize solver with a 3x3 RubiksCube instance"""
+    def __init__(self, cube, use_ida_star=False):
+        """Initialize solver with a 3x3 RubiksCube instance, optionally trying IDA* before LBL"""
+        # Color ids shared with RubiksCube stickers, compared as plain ints
+        self.WHITE, self.YELLOW, self.RED = WHITE, YELLOW, RED
+        self.ORANGE, self.GREEN, self.BLUE = ORANGE, GREEN, BLUE
+        
+        # Face indices: FRONT=0, BACK=1, RIGHT=2, LEFT=3, UP=4, DOWN=5
+        self.FRONT, self.BACK, self.RIGHT, self.LEFT, self.UP, self.DOWN = FRONT, BACK, RIGHT, LEFT, UP, DOWN
+        
+        # IDA* builds its pattern databases on first use and only solves short scrambles, so it is opt-in
+        self.use_ida_star = use_ida_star
+        
+        self.retarget(cube)
+    
+    def retarget(self, cube):
+        """Point this solver at another 3x3 RubiksCube, keeping everything cube-independent"""
         if not isinstance(cube, RubiksCube):
             raise ValueError("Solver requires RubiksCube instance")
         if cube.size != 3:
@@ -19,34 +354,49 @@ class RubiksCubeSolver:
         
         self.cube = cube
         self.solution_moves = []
+        self.solve_method = None
         
         # Ensure tracker exists
         if not hasattr(self.cube, 'tracker') or not self.cube.tracker:
             self.cube.tracker = CubeStateTracker()
         self.tracker = self.cube.tracker
         
-        # Define color mappings (cube internal representation)
-        # 0=WHITE, 1=YELLOW, 2=RED, 3=ORANGE, 4=GREEN, 5=BLUE
-        self.WHITE = 0
-        self.YELLOW = 1
-        self.RED = 2
-        self.ORANGE = 3
-        self.GREEN = 4
-        self.BLUE = 5
-        
-        # Face indices: FRONT=0, BACK=1, RIGHT=2, LEFT=3, UP=4, DOWN=5
-        self.FRONT, self.BACK, self.RIGHT, self.LEFT, self.UP, self.DOWN = 0, 1, 2, 3, 4, 5
+        # Move name -> bound cube method, resolved once instead of on every move
+        self._move_methods = {
+            'U': cube.move_U, "U'": cube.move_U_prime, 'U2': cube.move_U2,
+            'D': cube.move_D, "D'": cube.move_D_prime, 'D2': cube.move_D2,
+            'R': cube.move_R, "R'": cube.move_R_prime, 'R2': cube.move_R2,
+            'L': cube.move_L, "L'": cube.move_L_prime, 'L2': cube.move_L2,
+            'F': cube.move_F, "F'": cube.move_F_prime, 'F2': cube.move_F2,
+            'B': cube.move_B, "B'": cube.move_B_prime, 'B2': cube.move_B2,
+            'M': cube.move_M, 'E': cube.move_E, 'S': cube.move_S,
+        }
+        return self
     
     def solve(self):
-        """Main solving function using state-driven LBL method"""
-        print("=== STARTING STATE-DRIVEN 3x3 LBL SOLVE ===")
+        """Main solving function: two-phase if installed, opt-in IDA*, then state-driven LBL"""
+        print("=== STARTING STATE-DRIVEN 3x3 SOLVE ===")
         self.solution_moves = []
+        self.solve_method = None
         
         if self.cube.is_solved():
             print("Cube is already solved!")
             return self.solution_moves
         
+        # Fast path: near-optimal two-phase solution when the C extension is installed
+        if KOCIEMBA_AVAILABLE and self._solve_two_phase():
+            self.solve_method = SOLVE_METHOD_TWO_PHASE
+            print(f"\nTwo-phase solve completed with {len(self.solution_moves)} moves!")
+            return self.solution_moves
+        
+        # Opt-in: an optimal IDA* search, which only pays off for short scrambles
+        if self.use_ida_star and self._solve_ida_star():
+            self.solve_method = SOLVE_METHOD_IDA_STAR
+            print(f"\nIDA* solve completed with {len(self.solution_moves)} moves!")
+            return self.solution_moves
+        
         # Phase 1: White Cross on Down face
+        self.solve_method = SOLVE_METHOD_LBL
         print("\nPhase 1: Solving White Cross")
         self._solve_white_cross()
         
@@ -74,22 +424,86 @@ class RubiksCubeSolver:
         print(f"Final state: {'SOLVED' if self.cube.is_solved() else 'NOT SOLVED'}")
         return self.solution_moves
     
+    # ============ TWO-PHASE (KOCIEMBA) ============
+    
+    def _solve_two_phase(self):
+        """Solve with the Kociemba two-phase C extension, returns True if the cube ends solved"""
+        print("\nTwo-Phase: Solving with Kociemba algorithm")
+        
+        # Two-phase only uses face turns, so slice-displaced centers go home first
+        center_moves = self._find_center_restoring_moves()
+        if center_moves:
+            self._execute_algorithm(center_moves)
+            # Slice-only scrambles are solved now; kociemba would pad a solved cube with 13 turns
+            if self.cube.is_solved():
+                return True
+        
+        try:
+            solution = kociemba.solve(self._get_facelet_string())
+        except ValueError as e:
+            print(f"  ⚠ Two-phase solver rejected cube state: {e}")
+            return False
+        
+        self._execute_algorithm(solution)
+        return self.cube.is_solved()
+    
+    # ============ IDA* (PATTERN DATABASES) ============
+    
+    def _solve_ida_star(self):
+        """Solve with IDA* over the pattern databases, returns True if the cube ends solved"""
+        print(f"\nIDA*: Searching for a solution of at most {IDA_MAX_DEPTH} moves")
+        
+        # The search only uses face turns, so slice-displaced centers go home first
+        center_moves = self._find_center_restoring_moves()
+        if center_moves:
+            self._execute_algorithm(center_moves)
+        
+        solution = _ida_star_search(self.cube.stickers)
+        if solution is None:
+            print("  ⚠ No solution within the IDA* search limits, falling back to LBL")
+            return False
+        
+        if solution:
+            self._execute_algorithm(' '.join(solution))
+        return self.cube.is_solved()
+    
+    def _find_center_restoring_moves(self):
+        """Breadth-first search for the shortest slice-move sequence that puts every center home"""
+        stickers = self.cube.stickers
+        start = tuple(stickers[face * 9 + 4] for face in range(6))
+        goal = (0, 1, 2, 3, 4, 5)
+        
+        paths = {start: []}
+        frontier = [start]
+        while goal not in paths:
+            next_frontier = []
+            for centers in frontier:
+                for move, sources in SLICE_CENTER_SOURCES.items():
+                    moved = tuple(centers[source] for source in sources)
+                    if moved not in paths:
+                        paths[moved] = paths[centers] + [move]
+                        next_frontier.append(moved)
+            frontier = next_frontier
+        
+        return ' '.join(paths[goal])
+    
+    def _get_facelet_string(self):
+        """Get the 54-character URFDLB facelet string used by the two-phase solver"""
+        stickers = self.cube.stickers
+        
+        # Each face is named after the color of its center sticker
+        face_for_color = {stickers[face * 9 + 4]: letter
+                          for face, letter in zip(FACELET_FACE_ORDER, "URFDLB")}
+        
+        return ''.join(face_for_color[stickers[face * 9 + i]]
+                       for face in FACELET_FACE_ORDER for i in range(9))
+    
     # ============ PHASE 1: WHITE CROSS ============
     
     def _solve_white_cross(self):
         """Solve white cross on down face using state analysis"""
-        white_edge_positions = [
-            (self.DOWN, 0, 1),  # Down-Front edge
-            (self.DOWN, 1, 2),  # Down-Right edge  
-            (self.DOWN, 2, 1),  # Down-Back edge
-            (self.DOWN, 1, 0),  # Down-Left edge
-        ]
-        
-        adjacent_centers = [self.FRONT, self.RIGHT, self.BACK, self.LEFT]
-        
-        for i, (face, row, col) in enumerate(white_edge_positions):
-            target_center = adjacent_centers[i]
-            
+        # White edges go to Down-Front, Down-Right, Down-Back, Down-Left
+        for i in range(len(_BOTTOM_EDGE_LOCATIONS)):
             if self._is_white_edge_solved(i):
                 print(f"  ✓ White edge {i} already solved")
                 continue
@@ -109,114 +523,50 @@ class RubiksCubeSolver:
     
     def _is_white_edge_solved(self, edge_index):
         """Check if a specific white edge is correctly solved"""
-        edge_positions = [
-            ((self.DOWN, 0, 1), (self.FRONT, 2, 1)),  # Down-Front
-            ((self.DOWN, 1, 2), (self.RIGHT, 2, 1)),  # Down-Right
-            ((self.DOWN, 2, 1), (self.BACK, 2, 1)),   # Down-Back
-            ((self.DOWN, 1, 0), (self.LEFT, 2, 1)),   # Down-Left
-        ]
+        (index1, index2) = _BOTTOM_EDGE_INDICES[edge_index]
+        (color1, color2) = _WHITE_EDGE_COLORS[edge_index]
         
-        expected_colors = [
-            (self.WHITE, self.GREEN),   # White-Green edge
-            (self.WHITE, self.RED),     # White-Red edge
-            (self.WHITE, self.BLUE),    # White-Blue edge
-            (self.WHITE, self.ORANGE),  # White-Orange edge
-        ]
-        
-        (pos1, pos2) = edge_positions[edge_index]
-        (color1, color2) = expected_colors[edge_index]
-        
-        actual_color1 = self.cube.cube[pos1[0]][pos1[1]][pos1[2]]
-        actual_color2 = self.cube.cube[pos2[0]][pos2[1]][pos2[2]]
+        stickers = self.cube.stickers
+        actual_color1 = stickers[index1]
+        actual_color2 = stickers[index2]
         
         return actual_color1 == color1 and actual_color2 == color2
     
     def _find_white_edge_for_position(self, target_position):
         """Find a white edge piece that belongs in the target position"""
-        target_colors = [
-            (self.WHITE, self.GREEN),   # Position 0: White-Green
-            (self.WHITE, self.RED),     # Position 1: White-Red  
-            (self.WHITE, self.BLUE),    # Position 2: White-Blue
-            (self.WHITE, self.ORANGE),  # Position 3: White-Orange
-        ]
+        target_mask = _WHITE_EDGE_MASKS[target_position]
         
-        target_set = set(target_colors[target_position])
-        
-        # Search all edge positions for the target piece
-        edge_locations = [
-            # Top layer edges
-            ((self.UP, 0, 1), (self.BACK, 0, 1)),
-            ((self.UP, 1, 2), (self.RIGHT, 0, 1)),
-            ((self.UP, 2, 1), (self.FRONT, 0, 1)),
-            ((self.UP, 1, 0), (self.LEFT, 0, 1)),
-            # Bottom layer edges
-            ((self.DOWN, 0, 1), (self.FRONT, 2, 1)),
-            ((self.DOWN, 1, 2), (self.RIGHT, 2, 1)),
-            ((self.DOWN, 2, 1), (self.BACK, 2, 1)),
-            ((self.DOWN, 1, 0), (self.LEFT, 2, 1)),
-            # Middle layer edges
-            ((self.FRONT, 1, 0), (self.LEFT, 1, 2)),
-            ((self.FRONT, 1, 2), (self.RIGHT, 1, 0)),
-            ((self.BACK, 1, 0), (self.RIGHT, 1, 2)),
-            ((self.BACK, 1, 2), (self.LEFT, 1, 0)),
-        ]
-        
-        for location in edge_locations:
-            pos1, pos2 = location
-            color1 = self.cube.cube[pos1[0]][pos1[1]][pos1[2]]
-            color2 = self.cube.cube[pos2[0]][pos2[1]][pos2[2]]
-            
-            if set([color1, color2]) == target_set:
+        # Search all edge positions (top, bottom, middle layer) for the target piece
+        stickers = self.cube.stickers
+        for location, (index1, index2) in zip(_EDGE_LOCATIONS, _EDGE_INDICES):
+            if (1 << stickers[index1] | 1 << stickers[index2]) == target_mask:
                 return location
         
         return None
     
     def _move_white_edge_to_position(self, current_location, target_position):
         """Move a white edge from current location to target position"""
-        pos1, pos2 = current_location
-        color1 = self.cube.cube[pos1[0]][pos1[1]][pos1[2]]
+        max_attempts = 8
+        attempt = 0
+        current_top_pos = None
         
-        # If edge is in top layer, position it above target and insert
-        if pos1[0] == self.UP:  # Edge is in top layer
-            # Rotate top layer to position edge above target
-            face_map = {0: 2, 1: 1, 2: 0, 3: 3}  # Map top positions to rotations needed
-            current_top_pos = self._get_top_edge_position(pos1)
-            rotations_needed = (target_position - current_top_pos) % 4
+        # Bring the edge up to the top layer, then insert it from there
+        while current_top_pos is None and attempt < max_attempts:
+            pos1, pos2 = current_location
             
-            for _ in range(rotations_needed):
-                self._execute_move("U")
+            if pos1[0] == self.UP:  # Edge is in top layer
+                current_top_pos = self._get_top_edge_position(pos1)
+                break
             
-            # Insert the edge using appropriate algorithm
-            if target_position == 0:  # Front
-                self._execute_algorithm("F2")
-            elif target_position == 1:  # Right
-                self._execute_algorithm("R2")
-            elif target_position == 2:  # Back
-                self._execute_algorithm("B2")
-            elif target_position == 3:  # Left
-                self._execute_algorithm("L2")
-        
-        # If edge is in bottom layer but wrong position
-        elif pos1[0] == self.DOWN:
-            # Move to top layer first
-            current_bottom_pos = self._get_bottom_edge_position(pos1)
-            if current_bottom_pos == 0:  # Front
-                self._execute_algorithm("F2")
-            elif current_bottom_pos == 1:  # Right
-                self._execute_algorithm("R2")
-            elif current_bottom_pos == 2:  # Back
-                self._execute_algorithm("B2")
-            elif current_bottom_pos == 3:  # Left
-                self._execute_algorithm("L2")
+            # If edge is in bottom layer but wrong position
+            if pos1[0] == self.DOWN:
+                # A half turn of its side face lifts it straight up into the same top slot
+                current_bottom_pos = self._get_bottom_edge_position(pos1)
+                self._execute_algorithm(_HALF_TURNS[current_bottom_pos])
+                current_top_pos = current_bottom_pos
+                break
             
-            # Now it's in top layer, recursively solve
-            new_location = self._find_white_edge_for_position(target_position)
-            if new_location:
-                self._move_white_edge_to_position(new_location, target_position)
-        
-        # If edge is in middle layer
-        else:
-            # Extract to top layer using right-hand algorithm
+            # If edge is in middle layer, extract to top layer using right-hand algorithm
             if pos1[0] == self.FRONT and pos1[2] == 2:  # Front-right
                 self._execute_algorithm("R U R' U' F' U F")
             elif pos1[0] == self.FRONT and pos1[2] == 0:  # Front-left
@@ -226,47 +576,37 @@ class RubiksCubeSolver:
             elif pos1[0] == self.BACK and pos1[2] == 0:  # Back-left
                 self._execute_algorithm("L U L' U' B' U B")
             
-            # Now it's in top layer, recursively solve
-            new_location = self._find_white_edge_for_position(target_position)
-            if new_location:
-                self._move_white_edge_to_position(new_location, target_position)
+            # The extraction is not guaranteed to reach the top layer, so look again
+            current_location = self._find_white_edge_for_position(target_position)
+            if not current_location:
+                return
+            attempt += 1
+        
+        if current_top_pos is None:
+            print(f"  ⚠ White edge {target_position} not brought to top layer within attempts")
+            return
+        
+        # Rotate top layer to position edge above target, then insert it
+        rotations_needed = (target_position - current_top_pos) % 4
+        for _ in range(rotations_needed):
+            self._execute_move("U")
+        
+        self._execute_algorithm(_HALF_TURNS[target_position])
     
     def _get_top_edge_position(self, pos):
         """Get the position index (0-3) of an edge in the top layer"""
-        if pos == (self.UP, 2, 1):  # Up-Front
-            return 0
-        elif pos == (self.UP, 1, 2):  # Up-Right
-            return 1
-        elif pos == (self.UP, 0, 1):  # Up-Back
-            return 2
-        elif pos == (self.UP, 1, 0):  # Up-Left
-            return 3
-        return 0
+        return _TOP_EDGE_INDEX.get(pos, 0)
     
     def _get_bottom_edge_position(self, pos):
         """Get the position index (0-3) of an edge in the bottom layer"""
-        if pos == (self.DOWN, 0, 1):  # Down-Front
-            return 0
-        elif pos == (self.DOWN, 1, 2):  # Down-Right
-            return 1
-        elif pos == (self.DOWN, 2, 1):  # Down-Back
-            return 2
-        elif pos == (self.DOWN, 1, 0):  # Down-Left
-            return 3
-        return 0
+        return _BOTTOM_EDGE_INDEX.get(pos, 0)
     
     # ============ PHASE 2: WHITE CORNERS ============
     
     def _solve_white_corners(self):
         """Solve white corners using state analysis"""
-        corner_positions = [
-            (self.DOWN, 0, 2),  # Down-Front-Right
-            (self.DOWN, 0, 0),  # Down-Front-Left
-            (self.DOWN, 2, 0),  # Down-Back-Left
-            (self.DOWN, 2, 2),  # Down-Back-Right
-        ]
-        
-        for i, corner_pos in enumerate(corner_positions):
+        # White corners go to Down-Front-Right, Down-Front-Left, Down-Back-Left, Down-Back-Right
+        for i in range(len(_BOTTOM_CORNER_LOCATIONS)):
             if self._is_white_corner_solved(i):
                 print(f"  ✓ White corner {i} already solved")
                 continue
@@ -286,149 +626,82 @@ class RubiksCubeSolver:
     
     def _is_white_corner_solved(self, corner_index):
         """Check if a specific white corner is correctly solved"""
-        corner_positions = [
-            ((self.DOWN, 0, 2), (self.FRONT, 2, 2), (self.RIGHT, 2, 0)),  # DFR
-            ((self.DOWN, 0, 0), (self.FRONT, 2, 0), (self.LEFT, 2, 2)),   # DFL
-            ((self.DOWN, 2, 0), (self.BACK, 2, 2), (self.LEFT, 2, 0)),    # DBL
-            ((self.DOWN, 2, 2), (self.BACK, 2, 0), (self.RIGHT, 2, 2)),   # DBR
-        ]
+        index1, index2, index3 = _BOTTOM_CORNER_INDICES[corner_index]
+        expected = _WHITE_CORNER_MASKS[corner_index]
         
-        expected_colors = [
-            (self.WHITE, self.GREEN, self.RED),     # White-Green-Red
-            (self.WHITE, self.GREEN, self.ORANGE),  # White-Green-Orange
-            (self.WHITE, self.BLUE, self.ORANGE),   # White-Blue-Orange
-            (self.WHITE, self.BLUE, self.RED),      # White-Blue-Red
-        ]
-        
-        positions = corner_positions[corner_index]
-        expected = set(expected_colors[corner_index])
-        
-        actual_colors = set([
-            self.cube.cube[positions[0][0]][positions[0][1]][positions[0][2]],
-            self.cube.cube[positions[1][0]][positions[1][1]][positions[1][2]],
-            self.cube.cube[positions[2][0]][positions[2][1]][positions[2][2]]
-        ])
+        stickers = self.cube.stickers
+        bottom_color = stickers[index1]
+        actual_mask = 1 << bottom_color | 1 << stickers[index2] | 1 << stickers[index3]
         
         # Check if colors match and white is on bottom
-        return (actual_colors == expected and 
-                self.cube.cube[positions[0][0]][positions[0][1]][positions[0][2]] == self.WHITE)
+        return actual_mask == expected and bottom_color == self.WHITE
     
     def _find_white_corner_for_position(self, target_position):
         """Find a white corner piece that belongs in the target position"""
-        target_colors = [
-            set([self.WHITE, self.GREEN, self.RED]),     # Position 0
-            set([self.WHITE, self.GREEN, self.ORANGE]),  # Position 1
-            set([self.WHITE, self.BLUE, self.ORANGE]),   # Position 2
-            set([self.WHITE, self.BLUE, self.RED]),      # Position 3
-        ]
-        
-        target_set = target_colors[target_position]
-        
-        # Search all corner positions
-        corner_locations = [
-            # Top layer corners
-            ((self.UP, 2, 2), (self.FRONT, 0, 2), (self.RIGHT, 0, 0)),  # UFR
-            ((self.UP, 2, 0), (self.FRONT, 0, 0), (self.LEFT, 0, 2)),   # UFL
-            ((self.UP, 0, 0), (self.BACK, 0, 2), (self.LEFT, 0, 0)),    # UBL
-            ((self.UP, 0, 2), (self.BACK, 0, 0), (self.RIGHT, 0, 2)),   # UBR
-            # Bottom layer corners
-            ((self.DOWN, 0, 2), (self.FRONT, 2, 2), (self.RIGHT, 2, 0)),  # DFR
-            ((self.DOWN, 0, 0), (self.FRONT, 2, 0), (self.LEFT, 2, 2)),   # DFL
-            ((self.DOWN, 2, 0), (self.BACK, 2, 2), (self.LEFT, 2, 0)),    # DBL
-            ((self.DOWN, 2, 2), (self.BACK, 2, 0), (self.RIGHT, 2, 2)),   # DBR
-        ]
+        target_mask = _WHITE_CORNER_MASKS[target_position]
         
-        for location in corner_locations:
-            pos1, pos2, pos3 = location
-            colors = set([
-                self.cube.cube[pos1[0]][pos1[1]][pos1[2]],
-                self.cube.cube[pos2[0]][pos2[1]][pos2[2]],
-                self.cube.cube[pos3[0]][pos3[1]][pos3[2]]
-            ])
+        # Search all corner positions (top layer, then bottom layer)
+        stickers = self.cube.stickers
+        for location, (index1, index2, index3) in zip(_CORNER_LOCATIONS, _CORNER_INDICES):
+            mask = 1 << stickers[index1] | 1 << stickers[index2] | 1 << stickers[index3]
             
-            if colors == target_set:
+            if mask == target_mask:
                 return location
         
         return None
     
     def _move_white_corner_to_position(self, current_location, target_position):
         """Move a white corner from current location to target position"""
-        pos1, pos2, pos3 = current_location
+        max_attempts = 8
+        attempt = 0
         
-        # If corner is in top layer, position it above target and insert
-        if pos1[0] == self.UP:
-            # Position corner above target slot
-            current_top_pos = self._get_top_corner_position(pos1)
-            rotations_needed = (target_position - current_top_pos) % 4
-            
-            for _ in range(rotations_needed):
-                self._execute_move("U")
-            
-            # Insert corner using R'D'RD algorithm (for position 0)
-            # Adapt for other positions
-            if target_position == 0:  # Front-Right
-                self._insert_corner_algorithm_FR()
-            elif target_position == 1:  # Front-Left
-                self._insert_corner_algorithm_FL()
-            elif target_position == 2:  # Back-Left
-                self._insert_corner_algorithm_BL()
-            elif target_position == 3:  # Back-Right
-                self._insert_corner_algorithm_BR()
-        
-        # If corner is in bottom layer but wrong position or orientation
-        elif pos1[0] == self.DOWN:
-            # Extract to top layer first
-            current_bottom_pos = self._get_bottom_corner_position(pos1)
-            
-            if current_bottom_pos == 0:  # Front-Right
-                self._execute_algorithm("R' D' R D")
-            elif current_bottom_pos == 1:  # Front-Left
-                self._execute_algorithm("L D L' D'")
-            elif current_bottom_pos == 2:  # Back-Left
-                self._execute_algorithm("L' D' L D")
-            elif current_bottom_pos == 3:  # Back-Right
-                self._execute_algorithm("R D R' D'")
+        # If corner is in bottom layer but wrong position or orientation, extract it first
+        while current_location[0][0] == self.DOWN and attempt < max_attempts:
+            current_bottom_pos = self._get_bottom_corner_position(current_location[0])
+            self._execute_algorithm(_BOTTOM_CORNER_EXTRACTS[current_bottom_pos])
             
-            # Now it's in top layer, recursively solve
-            new_location = self._find_white_corner_for_position(target_position)
-            if new_location:
-                self._move_white_corner_to_position(new_location, target_position)
+            # The extraction does not always reach the top layer, so look again
+            current_location = self._find_white_corner_for_position(target_position)
+            if not current_location:
+                return
+            attempt += 1
+        
+        pos1 = current_location[0]
+        if pos1[0] != self.UP:
+            print(f"  ⚠ White corner {target_position} not brought to top layer within attempts")
+            return
+        
+        # Position corner above target slot
+        current_top_pos = self._get_top_corner_position(pos1)
+        rotations_needed = (target_position - current_top_pos) % 4
+        
+        for _ in range(rotations_needed):
+            self._execute_move("U")
+        
+        # Insert corner using R'D'RD algorithm (for position 0)
+        # Adapt for other positions
+        if target_position == 0:  # Front-Right
+            self._insert_corner_algorithm_FR()
+        elif target_position == 1:  # Front-Left
+            self._insert_corner_algorithm_FL()
+        elif target_position == 2:  # Back-Left
+            self._insert_corner_algorithm_BL()
+        elif target_position == 3:  # Back-Right
+            self._insert_corner_algorithm_BR()
     
     def _get_top_corner_position(self, pos):
         """Get the position index (0-3) of a corner in the top layer"""
-        if pos == (self.UP, 2, 2):  # Up-Front-Right
-            return 0
-        elif pos == (self.UP, 2, 0):  # Up-Front-Left
-            return 1
-        elif pos == (self.UP, 0, 0):  # Up-Back-Left
-            return 2
-        elif pos == (self.UP, 0, 2):  # Up-Back-Right
-            return 3
-        return 0
+        return _TOP_CORNER_INDEX.get(pos, 0)
     
     def _get_bottom_corner_position(self, pos):
         """Get the position index (0-3) of a corner in the bottom layer"""
-        if pos == (self.DOWN, 0, 2):  # Down-Front-Right
-            return 0
-        elif pos == (self.DOWN, 0, 0):  # Down-Front-Left
-            return 1
-        elif pos == (self.DOWN, 2, 0):  # Down-Back-Left
-            return 2
-        elif pos == (self.DOWN, 2, 2):  # Down-Back-Right
-            return 3
-        return 0
+        return _BOTTOM_CORNER_INDEX.get(pos, 0)
     
     def _insert_corner_algorithm_FR(self):
         """Insert corner into Front-Right position with proper orientation"""
         # Check white orientation and apply appropriate algorithm
         white_pos = self._find_white_on_corner_above_FR()
-        
-        if white_pos == "right":  # White on right face
-            self._execute_algorithm("R' D' R D")
-        elif white_pos == "front":  # White on front face
-            self._execute_algorithm("F D F' D' D' R' D' R")
-        else:  # White on top face
-            self._execute_algorithm("R' D2 R D R' D' R")
+        self._execute_algorithm(_FR_CORNER_INSERTS[white_pos])
     
     def _insert_corner_algorithm_FL(self):
         """Insert corner into Front-Left position"""
@@ -445,26 +718,16 @@ class RubiksCubeSolver:
     def _find_white_on_corner_above_FR(self):
         """Find which face has the white sticker on the corner above FR position"""
         # Check UFR corner position
-        if self.cube.cube[self.UP][2][2] == self.WHITE:
-            return "top"
-        elif self.cube.cube[self.FRONT][0][2] == self.WHITE:
-            return "front"
-        elif self.cube.cube[self.RIGHT][0][0] == self.WHITE:
-            return "right"
-        return "top"
+        top, front, right = _UFR_STICKERS(self.cube.stickers)
+        white = self.WHITE
+        return _UFR_WHITE_FACE[(top == white) | (front == white) << 1 | (right == white) << 2]
     
     # ============ PHASE 3: MIDDLE LAYER ============
     
     def _solve_middle_layer(self):
         """Solve middle layer edges using state analysis"""
-        middle_edge_positions = [
-            ((self.FRONT, 1, 0), (self.LEFT, 1, 2)),   # Front-Left edge
-            ((self.FRONT, 1, 2), (self.RIGHT, 1, 0)),  # Front-Right edge
-            ((self.BACK, 1, 0), (self.RIGHT, 1, 2)),   # Back-Right edge
-            ((self.BACK, 1, 2), (self.LEFT, 1, 0)),    # Back-Left edge
-        ]
-        
-        for i, edge_pos in enumerate(middle_edge_positions):
+        # Middle edges go to Front-Left, Front-Right, Back-Right, Back-Left
+        for i in range(len(_MIDDLE_EDGE_LOCATIONS)):
             if self._is_middle_edge_solved(i):
                 print(f"  ✓ Middle edge {i} already solved")
                 continue
@@ -484,66 +747,24 @@ class RubiksCubeSolver:
     
     def _is_middle_edge_solved(self, edge_index):
         """Check if a specific middle layer edge is correctly solved"""
-        edge_positions = [
-            ((self.FRONT, 1, 0), (self.LEFT, 1, 2)),   # Front-Left
-            ((self.FRONT, 1, 2), (self.RIGHT, 1, 0)),  # Front-Right
-            ((self.BACK, 1, 0), (self.RIGHT, 1, 2)),   # Back-Right
-            ((self.BACK, 1, 2), (self.LEFT, 1, 0)),    # Back-Left
-        ]
-        
-        expected_colors = [
-            (self.GREEN, self.ORANGE),  # Green-Orange edge
-            (self.GREEN, self.RED),     # Green-Red edge
-            (self.BLUE, self.RED),      # Blue-Red edge
-            (self.BLUE, self.ORANGE),   # Blue-Orange edge
-        ]
+        index1, index2 = _MIDDLE_EDGE_INDICES[edge_index]
+        color1, color2 = _MIDDLE_EDGE_COLORS[edge_index]
         
-        pos1, pos2 = edge_positions[edge_index]
-        color1, color2 = expected_colors[edge_index]
-        
-        actual_color1 = self.cube.cube[pos1[0]][pos1[1]][pos1[2]]
-        actual_color2 = self.cube.cube[pos2[0]][pos2[1]][pos2[2]]
+        stickers = self.cube.stickers
+        actual_color1 = stickers[index1]
+        actual_color2 = stickers[index2]
         
         return actual_color1 == color1 and actual_color2 == color2
     
     def _find_middle_edge_for_position(self, target_position):
         """Find a middle layer edge piece that belongs in the target position"""
-        target_colors = [
-            set([self.GREEN, self.ORANGE]),  # Position 0: Front-Left
-            set([self.GREEN, self.RED]),     # Position 1: Front-Right
-            set([self.BLUE, self.RED]),      # Position 2: Back-Right
-            set([self.BLUE, self.ORANGE]),   # Position 3: Back-Left
-        ]
-        
-        target_set = target_colors[target_position]
-        
-        # Search top layer edges (middle layer pieces shouldn't have white/yellow)
-        top_edge_locations = [
-            ((self.UP, 0, 1), (self.BACK, 0, 1)),   # Up-Back
-            ((self.UP, 1, 2), (self.RIGHT, 0, 1)),  # Up-Right
-            ((self.UP, 2, 1), (self.FRONT, 0, 1)),  # Up-Front
-            ((self.UP, 1, 0), (self.LEFT, 0, 1)),   # Up-Left
-        ]
-        
-        # Also search current middle layer positions
-        middle_edge_locations = [
-            ((self.FRONT, 1, 0), (self.LEFT, 1, 2)),   # Front-Left
-            ((self.FRONT, 1, 2), (self.RIGHT, 1, 0)),  # Front-Right
-            ((self.BACK, 1, 0), (self.RIGHT, 1, 2)),   # Back-Right
-            ((self.BACK, 1, 2), (self.LEFT, 1, 0)),    # Back-Left
-        ]
+        target_mask = _MIDDLE_EDGE_MASKS[target_position]
         
-        all_locations = top_edge_locations + middle_edge_locations
-        
-        for location in all_locations:
-            pos1, pos2 = location
-            colors = set([
-                self.cube.cube[pos1[0]][pos1[1]][pos1[2]],
-                self.cube.cube[pos2[0]][pos2[1]][pos2[2]]
-            ])
-            
-            # Make sure this edge doesn't contain white or yellow
-            if self.WHITE not in colors and self.YELLOW not in colors and colors == target_set:
+        # Search top layer edges, then the current middle layer positions
+        # (middle layer targets have no white/yellow, so an exact mask match excludes them)
+        stickers = self.cube.stickers
+        for location, (index1, index2) in zip(_MIDDLE_SEARCH_LOCATIONS, _MIDDLE_SEARCH_INDICES):
+            if (1 << stickers[index1] | 1 << stickers[index2]) == target_mask:
                 return location
         
         return None
@@ -569,9 +790,10 @@ class RubiksCubeSolver:
             current_top_pos = self._get_top_edge_position(pos1)
             
             # Check orientation and use appropriate insertion algorithm
+            stickers = self.cube.stickers
             edge_colors = [
-                self.cube.cube[pos1[0]][pos1[1]][pos1[2]],
-                self.cube.cube[pos2[0]][pos2[1]][pos2[2]]
+                stickers[_flat(*pos1)],
+                stickers[_flat(*pos2)]
             ]
             
             # Determine which algorithm to use based on target position and edge orientation
@@ -605,7 +827,7 @@ class RubiksCubeSolver:
             self._execute_move("U")
         
         # Check orientation: if front color is on front face, use right-hand algorithm
-        front_color = self.cube.cube[self.FRONT][0][1]
+        front_color = self.cube.stickers[_flat(self.FRONT, 0, 1)]
         if front_color == self.GREEN:
             self._execute_algorithm("U R U' R' U' F' U F")  # Right-hand
         else:
@@ -619,7 +841,7 @@ class RubiksCubeSolver:
             self._execute_move("U")
         
         # Check orientation
-        front_color = self.cube.cube[self.FRONT][0][1]
+        front_color = self.cube.stickers[_flat(self.FRONT, 0, 1)]
         if front_color == self.GREEN:
             self._execute_algorithm("U' L' U L U F U' F'")  # Left-hand
         else:
@@ -633,7 +855,7 @@ class RubiksCubeSolver:
             self._execute_move("U")
         
         # Check orientation
-        back_color = self.cube.cube[self.BACK][0][1]
+        back_color = self.cube.stickers[_flat(self.BACK, 0, 1)]
         if back_color == self.BLUE:
             self._execute_algorithm("U R' U' R U B U' B'")  # Right-hand adapted
         else:
@@ -647,7 +869,7 @@ class RubiksCubeSolver:
             self._execute_move("U")
         
         # Check orientation
-        back_color = self.cube.cube[self.BACK][0][1]
+        back_color = self.cube.stickers[_flat(self.BACK, 0, 1)]
         if back_color == self.BLUE:
             self._execute_algorithm("U' L U L' U B' U' B")   # Left-hand adapted
         else:
@@ -686,7 +908,7 @@ class RubiksCubeSolver:
     
     def _is_yellow_cross_complete(self):
         """Check if yellow cross is complete on top face"""
-        top = self.cube.cube[self.UP]
+        top = self._face_rows(self.UP)
         return (top[1][1] == self.YELLOW and  # Center
                 top[0][1] == self.YELLOW and  # Top edge
                 top[1][0] == self.YELLOW and  # Left edge
@@ -695,7 +917,7 @@ class RubiksCubeSolver:
     
     def _analyze_yellow_cross_case(self):
         """Analyze the current yellow cross pattern"""
-        top = self.cube.cube[self.UP]
+        top = self._face_rows(self.UP)
         edges = [
             top[0][1] == self.YELLOW,  # Top
             top[1][2] == self.YELLOW,  # Right
@@ -720,12 +942,12 @@ class RubiksCubeSolver:
     
     def _is_yellow_line_horizontal(self):
         """Check if yellow line is horizontal"""
-        top = self.cube.cube[self.UP]
+        top = self._face_rows(self.UP)
         return top[1][0] == self.YELLOW and top[1][2] == self.YELLOW
     
     def _orient_yellow_L_shape(self):
         """Orient L-shape so algorithm works correctly"""
-        top = self.cube.cube[self.UP]
+        top = self._face_rows(self.UP)
         
         # Find the L orientation and rotate to standard position
         if top[0][1] == self.YELLOW and top[1][0] == self.YELLOW:  # Top and Left
@@ -769,19 +991,19 @@ class RubiksCubeSolver:
     
     def _are_all_yellow_corners_oriented(self):
         """Check if all corners have yellow on top face"""
-        top = self.cube.cube[self.UP]
+        top = self._face_rows(self.UP)
         corners = [top[0][0], top[0][2], top[2][0], top[2][2]]
         return all(corner == self.YELLOW for corner in corners)
     
     def _count_oriented_yellow_corners(self):
         """Count how many corners have yellow on top"""
-        top = self.cube.cube[self.UP]
+        top = self._face_rows(self.UP)
         corners = [top[0][0], top[0][2], top[2][0], top[2][2]]
         return sum(1 for corner in corners if corner == self.YELLOW)
     
     def _position_oriented_corner_BR(self):
         """Position the one oriented corner to back-right position"""
-        top = self.cube.cube[self.UP]
+        top = self._face_rows(self.UP)
         corners = [
             (top[0][0], 0),  # Back-Left
             (top[0][2], 1),  # Back-Right
@@ -798,7 +1020,7 @@ class RubiksCubeSolver:
     
     def _position_two_oriented_corners(self):
         """Position two oriented corners appropriately for algorithm"""
-        top = self.cube.cube[self.UP]
+        top = self._face_rows(self.UP)
         oriented_positions = []
         
         corner_positions = [(0, 0), (0, 2), (2, 0), (2, 2)]
@@ -884,55 +1106,22 @@ class RubiksCubeSolver:
     def _are_corners_permuted(self):
         """Check if corners are in correct positions (ignoring orientation)"""
         # Check if each corner has the right combination of colors
-        corner_positions = [
-            ((self.UP, 0, 0), (self.BACK, 0, 2), (self.LEFT, 0, 0)),    # UBL
-            ((self.UP, 0, 2), (self.BACK, 0, 0), (self.RIGHT, 0, 2)),   # UBR
-            ((self.UP, 2, 0), (self.FRONT, 0, 0), (self.LEFT, 0, 2)),   # UFL
-            ((self.UP, 2, 2), (self.FRONT, 0, 2), (self.RIGHT, 0, 0)),  # UFR
-        ]
-        
-        expected_color_sets = [
-            set([self.YELLOW, self.BLUE, self.ORANGE]),    # UBL
-            set([self.YELLOW, self.BLUE, self.RED]),       # UBR
-            set([self.YELLOW, self.GREEN, self.ORANGE]),   # UFL
-            set([self.YELLOW, self.GREEN, self.RED]),      # UFR
-        ]
-        
-        for i, positions in enumerate(corner_positions):
-            actual_colors = set([
-                self.cube.cube[positions[0][0]][positions[0][1]][positions[0][2]],
-                self.cube.cube[positions[1][0]][positions[1][1]][positions[1][2]],
-                self.cube.cube[positions[2][0]][positions[2][1]][positions[2][2]]
-            ])
+        stickers = self.cube.stickers
+        for (index1, index2, index3), expected_mask in _LAST_LAYER_CORNERS:
+            actual_mask = 1 << stickers[index1] | 1 << stickers[index2] | 1 << stickers[index3]
             
-            if actual_colors != expected_color_sets[i]:
+            if actual_mask != expected_mask:
                 return False
         
         return True
     
     def _are_edges_permuted(self):
         """Check if edges are in correct positions"""
-        edge_positions = [
-            ((self.UP, 0, 1), (self.BACK, 0, 1)),   # UB
-            ((self.UP, 1, 2), (self.RIGHT, 0, 1)),  # UR
-            ((self.UP, 2, 1), (self.FRONT, 0, 1)),  # UF
-            ((self.UP, 1, 0), (self.LEFT, 0, 1)),   # UL
-        ]
-        
-        expected_color_sets = [
-            set([self.YELLOW, self.BLUE]),     # UB
-            set([self.YELLOW, self.RED]),      # UR
-            set([self.YELLOW, self.GREEN]),    # UF
-            set([self.YELLOW, self.ORANGE]),   # UL
-        ]
-        
-        for i, positions in enumerate(edge_positions):
-            actual_colors = set([
-                self.cube.cube[positions[0][0]][positions[0][1]][positions[0][2]],
-                self.cube.cube[positions[1][0]][positions[1][1]][positions[1][2]]
-            ])
+        stickers = self.cube.stickers
+        for (index1, index2), expected_mask in _LAST_LAYER_EDGES:
+            actual_mask = 1 << stickers[index1] | 1 << stickers[index2]
             
-            if actual_colors != expected_color_sets[i]:
+            if actual_mask != expected_mask:
                 return False
         
         return True
@@ -955,16 +1144,15 @@ class RubiksCubeSolver:
     
     # ============ UTILITY METHODS ============
     
+    def _face_rows(self, face):
+        """The three rows of one face as tuples, sliced from the flat stickers"""
+        stickers = self.cube.stickers
+        base = face * 9
+        return (stickers[base:base + 3], stickers[base + 3:base + 6], stickers[base + 6:base + 9])
+    
     def _execute_move(self, move):
         """Execute a single move and track it"""
-        move_methods = {
-            'U': self.cube.move_U, "U'": self.cube.move_U_prime, 'U2': self.cube.move_U2,
-            'D': self.cube.move_D, "D'": self.cube.move_D_prime, 'D2': self.cube.move_D2,
-            'R': self.cube.move_R, "R'": self.cube.move_R_prime, 'R2': self.cube.move_R2,
-            'L': self.cube.move_L, "L'": self.cube.move_L_prime, 'L2': self.cube.move_L2,
-            'F': self.cube.move_F, "F'": self.cube.move_F_prime, 'F2': self.cube.move_F2,
-            'B': self.cube.move_B, "B'": self.cube.move_B_prime, 'B2': self.cube.move_B2,
-        }
+        move_methods = self._move_methods
         
         if move in move_methods:
             move_methods[move]()
@@ -974,11 +1162,22 @@ class RubiksCubeSolver:
             print(f"    Unknown move: {move}")
     
     def _execute_algorithm(self, algorithm):
-        """Execute a sequence of moves"""
-        moves = algorithm.split()
+        """Execute a sequence of moves as one fused sticker permutation"""
+        move_methods = self._move_methods
+        tokens = _parse_algorithm(algorithm)
         print(f"    Algorithm: {algorithm}")
-        for move in moves:
-            self._execute_move(move)
+        
+        for move in tokens:
+            if move in move_methods:
+                print(f"    Executed: {move}")
+            else:
+                print(f"    Unknown move: {move}")
+        
+        # Every known move is a 3x3 table move; a fixed algorithm fuses into one cached gather
+        moves = tuple(move for move in tokens if move in move_methods)
+        if moves:
+            self.cube.apply_algorithm(moves)
+            self.solution_moves.extend(moves)
     
     def get_solving_statistics(self):
         """Return comprehensive statistics about the solving process"""
@@ -989,13 +1188,14 @@ class RubiksCubeSolver:
                 tracker_info = {
                     'is_solved': self.tracker.is_cube_solved(),
                     'valid': True,
-                    'solved_edges': sum(1 for i in range(12) if self.tracker.is_edge_solved(i)),
-                    'solved_corners': sum(1 for i in range(8) if self.tracker.is_corner_solved(i))
+                    'solved_edges': self.tracker.count_solved_edges(),
+                    'solved_corners': self.tracker.count_solved_corners()
                 }
             except Exception as e:
                 tracker_info = {'valid': False, 'error': str(e)}
         
         return {
+            'method': self.solve_method,
             'total_moves': len(self.solution_moves),
             'solution_sequence': ' '.join(self.solution_moves),
             'is_solved': self.cube.is_solved(),
@@ -1028,7 +1228,7 @@ def demo_state_driven_solver():
     print(f"Tracker validation: {diagnostics['validation_status']['message']}")
     
     # Solve using state-driven method
-    print("\n3. Starting state-driven LBL solve...")
+    print("\n3. Starting state-driven solve...")
     solver = RubiksCubeSolver(cube)
     solution = solver.solve()
     
@@ -1039,6 +1239,7 @@ def demo_state_driven_solver():
     # Display statistics
     stats = solver.get_solving_statistics()
     print(f"\nSOLVING STATISTICS:")
+    print(f"Method: {stats['method']}")
     print(f"Total moves: {stats['total_moves']}")
     print(f"Cube solved: {stats['is_solved']}")
     print(f"Efficiency score: {stats['efficiency_score']}")
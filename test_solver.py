@@ -0,0 +1,54 @@
+"""
+Tests for the opt-in IDA* pattern-database search in solver.py
+Run with: python -m unittest test_solver
+"""
+
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+import solver
+from rubiks_cube import RubiksCube
+from solver import RubiksCubeSolver, _ida_star_search
+
+SCRAMBLE = "R U F'"
+
+
+def _scrambled_cube():
+    """A 3x3 cube three face turns from solved"""
+    cube = RubiksCube(3)
+    cube.execute_moves(SCRAMBLE)
+    return cube
+
+
+class IdaStarTest(unittest.TestCase):
+    def test_short_scramble_solved_optimally(self):
+        cube = _scrambled_cube()
+        solution = _ida_star_search(cube.stickers)
+
+        self.assertEqual(len(solution), 3)
+        cube.execute_moves(' '.join(solution))
+        self.assertTrue(cube.is_solved())
+
+    def test_solver_runs_ida_star_when_opted_in(self):
+        cube = _scrambled_cube()
+        with mock.patch.object(solver, 'KOCIEMBA_AVAILABLE', False), \
+                contextlib.redirect_stdout(io.StringIO()):
+            moves = RubiksCubeSolver(cube, use_ida_star=True).solve()
+
+        self.assertEqual(len(moves), 3)
+        self.assertTrue(cube.is_solved())
+
+    def test_solver_skips_ida_star_by_default(self):
+        cube = _scrambled_cube()
+        with mock.patch.object(solver, 'KOCIEMBA_AVAILABLE', False), \
+                mock.patch.object(RubiksCubeSolver, '_solve_ida_star') as solve_ida_star, \
+                contextlib.redirect_stdout(io.StringIO()):
+            RubiksCubeSolver(cube).solve()
+
+        solve_ida_star.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,74 +17,66 @@ except ImportError:
     print("pip install pygame PyOpenGL PyOpenGL_accelerate")
     VISUALIZATION_AVAILABLE = False
 
+from functools import lru_cache
 from rubiks_cube import RubiksCube
 
+@lru_cache(maxsize=16)
+def _unfolded_template(size):
+    """Build the unfolded-cube layout for a size once, with {i} for flat sticker i"""
+    area = size * size
+    
+    def cells(face, row):
+        start = face * area + row * size
+        return ''.join(f" {{{i}}} " for i in range(start, start + size))
+    
+    lines = ["\n" + "="*60, f"           {size}x{size}x{size} CUBE STATE", "="*60]
+    
+    # Top face (Up) - face index 4
+    lines.append(f"{'':>{size*3+8}}U P   F A C E")
+    lines.extend(f"{'':>{size*3+6}}" + cells(4, row) for row in range(size))
+    lines.append("")
+    
+    # Middle row: Left(3), Front(0), Right(2), Back(1)
+    faces = [3, 0, 2, 1]
+    labels = ["L E F T", "F R O N T", "R I G H T", "B A C K"]
+    lines.append(''.join(f" {label:^{size*3}}" for label in labels))
+    lines.extend(" " + ''.join(cells(face, row) + " " for face in faces) for row in range(size))
+    lines.append("")
+    
+    # Bottom face (Down) - face index 5
+    lines.append(f"{'':>{size*3+6}}D O W N   F A C E")
+    lines.extend(f"{'':>{size*3+6}}" + cells(5, row) for row in range(size))
+    
+    lines.append("="*60)
+    lines.append(f"Cube size: {size}x{size}x{size} | Total stickers: {6 * size * size}")
+    return '\n'.join(lines)
+
 class SimpleVisualizer:
     """Text-based 2D cube visualization - works with any cube size"""
     
+    # Shared by every instance, so a visualizer is cheap to build and keep per cube
+    color_chars = {
+        0: 'W',  # White
+        1: 'Y',  # Yellow
+        2: 'R',  # Red
+        3: 'O',  # Orange
+        4: 'G',  # Green
+        5: 'B',  # Blue
+    }
+    
     def __init__(self, cube):
         """Initialize simple text-based visualizer"""
         self.cube = cube
-        self.color_chars = {
-            0: 'W',  # White
-            1: 'Y',  # Yellow
-            2: 'R',  # Red
-            3: 'O',  # Orange
-            4: 'G',  # Green
-            5: 'B',  # Blue
-        }
         print(f"✓ Text visualizer initialized for {cube.size}x{cube.size}x{cube.size} cube")
     
     def draw_unfolded_cube(self):
         """Draw cube in unfolded 2D format - adapts to cube size"""
-        size = self.cube.size
-        
-        print(f"\n" + "="*60)
-        print(f"           {size}x{size}x{size} CUBE STATE")
-        print("="*60)
-        
-        # Top face (Up) - face index 4
-        print(f"{'':>{size*3+8}}U P   F A C E")
-        up_face = self.cube.cube[4]
-        for row in up_face:
-            print(f"{'':>{size*3+6}}", end="")
-            for cell in row:
-                print(f" {self.color_chars[cell]} ", end="")
-            print()
-        
-        print()
-        
-        # Middle row: Left(3), Front(0), Right(2), Back(1)
-        faces = [3, 0, 2, 1]
-        labels = ["L E F T", "F R O N T", "R I G H T", "B A C K"]
-        
-        # Print face labels
-        for label in labels:
-            print(f" {label:^{size*3}}", end="")
-        print()
-        
-        # Print face contents row by row
-        for i in range(size):
-            print(" ", end="")
-            for face_idx in faces:
-                for cell in self.cube.cube[face_idx][i]:
-                    print(f" {self.color_chars[cell]} ", end="")
-                print(" ", end="")
-            print()
-        
-        print()
-        
-        # Bottom face (Down) - face index 5
-        print(f"{'':>{size*3+6}}D O W N   F A C E")
-        down_face = self.cube.cube[5]
-        for row in down_face:
-            print(f"{'':>{size*3+6}}", end="")
-            for cell in row:
-                print(f" {self.color_chars[cell]} ", end="")
-            print()
-        
-        print("="*60)
-        print(f"Cube size: {size}x{size}x{size} | Total stickers: {6 * size * size}")
+        print(self.render_to_string())
+    
+    def render_to_string(self):
+        """Render the unfolded layout by filling the per-size template with sticker letters"""
+        chars = self.color_chars
+        return _unfolded_template(self.cube.size).format(*[chars[cell] for cell in self.cube.stickers])
     
     def animate_move(self, move):
         """Show before/after states for a move"""